@@ -0,0 +1,77 @@
+"""
+Synthetic resume / JD text used by the benchmarks.
+
+Nothing here is meant to look realistic beyond having the right mix of
+skills, headings and filler prose for the parsers to chew on.
+"""
+
+import random
+from typing import List
+
+
+FILLER = (
+    "Worked closely with product and design to deliver features on time. "
+    "Improved reliability of the platform and mentored junior colleagues. "
+    "Owned the roadmap for internal tooling and reduced operational toil. "
+)
+
+SKILL_SENTENCES = [
+    "Built REST APIs with Python, FastAPI and PostgreSQL deployed on AWS.",
+    "Wrote high performance services in C++ and C# for trading systems.",
+    "Shipped React and Node.js front ends with TypeScript and Tailwind.",
+    "Set up CI/CD pipelines with GitHub Actions, Docker and Kubernetes.",
+    "Trained machine learning models using PyTorch, pandas and NumPy.",
+    "Maintained Kafka and Spark jobs feeding an Elasticsearch cluster.",
+]
+
+
+def resume_text(target_chars: int, seed: int = 0) -> str:
+    """Return a resume-like document of roughly ``target_chars`` characters."""
+    rng = random.Random(seed)
+    parts: List[str] = [
+        "Jane Doe",
+        "jane.doe@example.com | +1 555 123 4567",
+        "",
+        "Skills",
+        "Python, Java, SQL, Docker, Git, Linux",
+        "",
+        "Experience",
+    ]
+    size = sum(len(p) + 1 for p in parts)
+    while size < target_chars:
+        line = rng.choice(SKILL_SENTENCES) if rng.random() < 0.4 else FILLER
+        parts.append(line)
+        size += len(line) + 1
+    parts.extend(["", "Education", "B.Tech in Computer Science, XYZ University"])
+    return "\n".join(parts)
+
+
+RESUME_LINES = [
+    "Senior Software Engineer, ABC Corp",
+    "Jan 2020 - Present",
+    "- Built APIs with Python and FastAPI",
+    "- Led a team of 5 developers",
+    "- Improved p95 latency by 30%",
+    "Data Analyst Intern, DEF Ltd",
+    "Duration: Nov 2025 - Dec 2025",
+    "- Designed dashboards for the sales team",
+    "- Wrote unit tests and documentation",
+    "Mentored junior staff through code reviews",
+    "B.Tech in Computer Science, XYZ University",
+    "CGPA: 8.9 / 10",
+    "AWS Certified Solutions Architect",
+]
+
+LINES_PER_PAGE = 55
+
+
+def long_resume(pages: int, seed: int = 0) -> str:
+    """A multi-page resume made of short, typical resume lines."""
+    rng = random.Random(seed)
+    head = [
+        "Jane Doe",
+        "jane.doe@example.com | +1 555 123 4567",
+        "Experience",
+    ]
+    body = [rng.choice(RESUME_LINES) for _ in range(pages * LINES_PER_PAGE)]
+    return "\n".join(head + body)
@@ -0,0 +1,60 @@
+"""
+Minimal PDF writer for benchmark fixtures (text-only, Helvetica, no deps).
+"""
+
+from typing import List
+
+
+def _escape(text: str) -> str:
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(pages: List[str]) -> bytes:
+    """A valid PDF with one page per entry of ``pages``, one text line per line."""
+    objects: List[bytes] = []
+    n_pages = len(pages)
+    # 1: catalog, 2: page tree, 3: font, then (page, content) pairs
+    kids = " ".join(f"{4 + 2 * i} 0 R" for i in range(n_pages))
+    objects.append(b"<< /Type /Catalog /Pages 2 0 R >>")
+    objects.append(f"<< /Type /Pages /Kids [{kids}] /Count {n_pages} >>".encode())
+    objects.append(b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>")
+    for i, page_text in enumerate(pages):
+        lines = ["BT", "/F1 10 Tf", "12 TL", "50 800 Td"]
+        for line in page_text.splitlines():
+            lines.append(f"({_escape(line)}) Tj T*")
+        lines.append("ET")
+        stream = "\n".join(lines).encode("latin-1", errors="replace")
+        objects.append(
+            f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+            f"/Resources << /Font << /F1 3 0 R >> >> /Contents {5 + 2 * i} 0 R >>".encode()
+        )
+        objects.append(
+            b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream"
+        )
+
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    for offset in offsets:
+        out += b"%010d 00000 n \n" % offset
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (
+        len(objects) + 1,
+        xref,
+    )
+    return bytes(out)
+
+
+def make_resume_pdf(pages: int, seed: int = 0) -> bytes:
+    from ._corpus import LINES_PER_PAGE, long_resume
+
+    lines = long_resume(pages, seed).splitlines()
+    return make_pdf(
+        [
+            "\n".join(lines[i : i + LINES_PER_PAGE])
+            for i in range(0, len(lines), LINES_PER_PAGE)
+        ]
+    )
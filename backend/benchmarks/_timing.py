@@ -0,0 +1,24 @@
+"""Best-of-N timing shared by the benchmarks."""
+
+import time
+from typing import Awaitable, Callable
+
+
+def best_of(fn: Callable[[], object], repeat: int = 5) -> float:
+    """Fastest of ``repeat`` calls to ``fn``, in seconds."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+async def best_of_async(fn: Callable[[], Awaitable[object]], repeat: int = 5) -> float:
+    """``best_of`` for a coroutine function."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        await fn()
+        best = min(best, time.perf_counter() - start)
+    return best
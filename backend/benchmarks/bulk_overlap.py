@@ -0,0 +1,63 @@
+"""
+Scoring one JD against many stored candidates: Python sets vs packed bitsets.
+
+Run from the repository root:
+
+    python -m backend.benchmarks.bulk_overlap
+"""
+
+import random
+import time
+
+from ..services.matcher import MatchEngine
+from ..utils.skill_bitset import pack_bitsets
+from ..utils.skills_db import get_vocabulary, normalise_skill
+
+
+CANDIDATE_COUNTS = [1_000, 10_000, 50_000]
+
+
+def set_overlap(candidates, jd_skills):
+    """The pre-bitset approach: normalise + set intersection per candidate."""
+    jd_norm = {normalise_skill(s) for s in jd_skills}
+    return [
+        len({normalise_skill(s) for s in skills} & jd_norm) / len(jd_norm) * 100
+        for skills in candidates
+    ]
+
+
+def main() -> None:
+    rng = random.Random(0)
+    engine = MatchEngine()
+    vocabulary = get_vocabulary()
+    skills_by_id, skills_to_bits = vocabulary.skills_by_id, vocabulary.skills_to_bits
+    jd_skills = [s.title() for s in rng.sample(skills_by_id, 12)]
+    jd_bits = skills_to_bits(jd_skills)
+
+    print(f"{'candidates':>10} {'sets ms':>9} {'pack ms':>9} {'bitset ms':>10}")
+    for count in CANDIDATE_COUNTS:
+        candidates = [
+            [s.title() for s in rng.sample(skills_by_id, rng.randint(5, 25))]
+            for _ in range(count)
+        ]
+
+        start = time.perf_counter()
+        expected = set_overlap(candidates, jd_skills)
+        sets_ms = (time.perf_counter() - start) * 1e3
+
+        # Packing happens once when candidates are stored, not per JD
+        start = time.perf_counter()
+        bitsets = [skills_to_bits(c) for c in candidates]
+        matrix = pack_bitsets(bitsets, len(vocabulary))
+        pack_ms = (time.perf_counter() - start) * 1e3
+
+        start = time.perf_counter()
+        scores = engine.skill_match_percentages(jd_bits, matrix)
+        bitset_ms = (time.perf_counter() - start) * 1e3
+
+        assert all(abs(a - b) < 1e-9 for a, b in zip(expected, scores))
+        print(f"{count:>10} {sets_ms:>9.1f} {pack_ms:>9.1f} {bitset_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Latency cost of typo-tolerant skill matching, reported apart from exact matching.
+
+Run from the repository root:
+
+    python -m backend.benchmarks.fuzzy_skills
+"""
+
+import time
+
+from ..utils.fuzzy_skills import TrigramSkillIndex
+from ..utils.skills_db import CORE_SKILLS, SKILL_ALIASES, SkillVocabulary
+from ._corpus import resume_text
+from ._timing import best_of
+from .vocabulary_scaling import synthetic_vocabulary
+
+
+TYPOS = "Skilled in Pyhton, Kubernets, Postgress, Tensorflw and Elasticserch."
+DOC_SIZES = [1_000, 10_000, 100_000]
+
+
+def main() -> None:
+    vocabulary = SkillVocabulary(CORE_SKILLS, SKILL_ALIASES, cache_dir="", fuzzy=True)
+    index = vocabulary.fuzzy_index
+    exact = vocabulary.matcher.find_all(TYPOS)
+    found = vocabulary.scan(TYPOS)
+    print(TYPOS)
+    print("  exact :", [vocabulary.skills_by_id[i] for i in exact])
+    print("  fuzzy :", [(vocabulary.skills_by_id[i], TYPOS[s:e]) for i, s, e in found])
+    print()
+
+    print(f"{'chars':>8} {'exact ms':>9} {'+fuzzy ms':>10} {'fuzzy cold ms':>14}")
+    for size in DOC_SIZES:
+        text = resume_text(size) + "\n" + TYPOS
+        exact = best_of(lambda: list(vocabulary.matcher.finditer(text)))
+        covered = [(s, e) for s, e, _ in vocabulary.matcher.finditer(text)]
+        # Warm: memoised token lookups, as in a long-running worker
+        warm = best_of(lambda: index.matches(text, covered))
+        index._memo.clear()
+        cold = best_of(lambda: index.matches(text, covered), repeat=1)
+        print(
+            f"{len(text):>8} {exact * 1e3:>9.2f} {warm * 1e3:>10.2f}"
+            f" {cold * 1e3:>14.2f}"
+        )
+
+    print()
+    print(f"{'vocab':>8} {'index words':>12} {'build ms':>9} {'lookup us':>10}")
+    for size in (130, 5_000, 50_000):
+        lookup = SkillVocabulary(sorted(synthetic_vocabulary(size))).lookup
+        start = time.perf_counter()
+        big = TrigramSkillIndex(lookup)
+        build = time.perf_counter() - start
+        words = ["pyhton", "kubernets", "tensorflw", "elasticserch", "unrelated"]
+
+        def cold_lookups():
+            big._memo.clear()
+            for word in words:
+                big.lookup(word)
+
+        per_lookup = best_of(cold_lookups) / len(words)
+        print(
+            f"{len(lookup):>8} {len(big):>12} {build * 1e3:>9.1f}"
+            f" {per_lookup * 1e6:>10.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
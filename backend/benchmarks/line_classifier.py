@@ -0,0 +1,61 @@
+"""
+Education / experience / certification line extraction on long resumes:
+the single-pass LineClassifier vs the previous three keyword-list scans.
+
+Run from the repository root:
+
+    python -m backend.benchmarks.line_classifier
+"""
+
+from typing import List
+
+from ..services.line_classifier import JOB, KEYWORDS, NOT_EXPERIENCE, EDUCATION
+from ..services.resume_parser import LINE_CLASSIFIER
+from ..services.section_segmenter import segment_resume
+from ._corpus import long_resume
+from ._timing import best_of
+
+
+PAGE_COUNTS = [1, 5, 20]
+
+
+def triple_scan(lines: List[str]):
+    """The previous extractors: each walks every line with its own lists."""
+    education = [
+        line for line in lines if any(k in line.lower() for k in KEYWORDS[EDUCATION])
+    ]
+    experience = []
+    for line in lines:
+        lower = line.lower()
+        if lower in {"experience", "work experience", "professional experience"}:
+            continue
+        if any(bad in lower for bad in KEYWORDS[NOT_EXPERIENCE]):
+            continue
+        if any(k in lower for k in KEYWORDS[JOB]):
+            experience.append(line)
+    certifications = []
+    for line in lines:
+        lower = line.lower()
+        if "certification" in lower or "certified" in lower:
+            certifications.append(line)
+    return education, experience, certifications
+
+
+def main() -> None:
+    print(f"{'pages':>6} {'lines':>6} {'triple ms':>10} {'single ms':>10} {'speedup':>8}")
+    for pages in PAGE_COUNTS:
+        lines = [l.strip() for l in long_resume(pages).splitlines() if l.strip()]
+        # Single-section layout so both sides see exactly the same lines
+        sections = segment_resume(lines[3:])
+        assert LINE_CLASSIFIER.classify(sections) == triple_scan(lines[3:])
+
+        old = best_of(lambda: triple_scan(sections.lines), repeat=7)
+        new = best_of(lambda: LINE_CLASSIFIER.classify(sections), repeat=7)
+        print(
+            f"{pages:>6} {len(sections.lines):>6} {old * 1e3:>10.2f}"
+            f" {new * 1e3:>10.2f} {old / new:>7.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
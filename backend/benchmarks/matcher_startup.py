@@ -0,0 +1,49 @@
+"""
+Worker start-up cost of the skill matcher: cold build vs on-disk cache load.
+
+Run from the repository root:
+
+    python -m backend.benchmarks.matcher_startup
+"""
+
+import tempfile
+import time
+
+from ..utils.skill_matcher import ENGINES
+from ..utils.skills_db import CORE_SKILLS, SKILL_ALIASES, SkillVocabulary
+from .vocabulary_scaling import synthetic_vocabulary
+
+
+def _timed_load(skills, aliases, engine: str, cache_dir: str) -> float:
+    start = time.perf_counter()
+    SkillVocabulary(skills, aliases, engine=engine, cache_dir=cache_dir)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    vocabularies = {
+        "CORE_SKILLS": (CORE_SKILLS, SKILL_ALIASES),
+        "50k synthetic": (sorted(synthetic_vocabulary(50_000)), SKILL_ALIASES),
+    }
+    print(
+        f"{'vocabulary':>14} {'engine':>10} {'cold ms':>9} {'cached ms':>10}"
+        f" {'speedup':>8}"
+    )
+    for label, (skills, aliases) in vocabularies.items():
+        for engine in ENGINES:
+            with tempfile.TemporaryDirectory() as cache_dir:
+                # First load builds and writes the cache; no-cache build is
+                # timed separately so file writes don't count as "cold".
+                cold = _timed_load(skills, aliases, engine, cache_dir="")
+                _timed_load(skills, aliases, engine, cache_dir)
+                cached = min(
+                    _timed_load(skills, aliases, engine, cache_dir) for _ in range(3)
+                )
+            print(
+                f"{label:>14} {engine:>10} {cold * 1e3:>9.1f} {cached * 1e3:>10.1f}"
+                f" {cold / cached:>7.1f}x"
+            )
+
+
+if __name__ == "__main__":
+    main()
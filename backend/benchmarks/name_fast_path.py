@@ -0,0 +1,106 @@
+"""
+Rule-based name detector as a fast path in front of spaCy NER: the share of
+resumes that never reach spaCy, how often the fast path's answer is right,
+and the name-step and whole-parse latency against always running NER.
+
+Without the spaCy model only the fast-path numbers are reported. Run from
+the repository root:
+
+    python -m backend.benchmarks.name_fast_path
+"""
+
+import random
+import time
+
+from ..services import resume_parser
+from ..services.document import Document
+from ..services.name_detector import NAME_CONFIDENCE_THRESHOLD, detect_name
+from ..services.resume_parser import ResumeParser
+from ..services.spacy_assistant import get_spacy_assistant
+from ..utils.skills_db import get_vocabulary
+from ._corpus import long_resume
+
+
+DOCS = 400
+PAGES = 2
+
+# Mostly common names, plus the awkward cases that should fall back to NER
+KNOWN_NAMES = ["Priya Sharma", "Michael Chen", "Anna K. Lee", "Rahul Verma", "Sofia Garcia"]
+UNKNOWN_NAMES = ["Zorawar Quennell", "Oluwaseun Adebayo", "Thandiwe Mokoena"]
+TITLES = ["", "", "", "Curriculum Vitae", "Senior Software Engineer"]
+
+
+def fixture_corpus(n: int, seed: int = 0):
+    """``(text, true_name)`` pairs with varied headers over ``long_resume`` bodies."""
+    rng = random.Random(seed)
+    corpus = []
+    for i in range(n):
+        name = rng.choice(UNKNOWN_NAMES if rng.random() < 0.2 else KNOWN_NAMES)
+        shown = name.upper() if rng.random() < 0.15 else name
+        email = name.lower().replace(" ", ".").replace("..", ".") + "@example.com"
+        title = rng.choice(TITLES)
+        head = [title, shown] if title == "Curriculum Vitae" else [shown, title]
+        head = [line for line in head if line]
+        body = long_resume(PAGES, seed=i).split("\n", 2)[2]
+        corpus.append(("\n".join(head + [f"{email} | +1 555 010 {i:04d}", body]), name))
+    return corpus
+
+
+def _ms_per_doc(fn, docs) -> float:
+    start = time.perf_counter()
+    for doc in docs:
+        fn(doc)
+    return (time.perf_counter() - start) * 1000 / len(docs)
+
+
+def main() -> None:
+    parser = ResumeParser()
+    vocabulary = get_vocabulary()
+    corpus = fixture_corpus(DOCS)
+
+    fast = [parser._fast_name(Document(text)) for text, _ in corpus]
+    confident = [
+        (name, truth)
+        for (name, confidence), (_, truth) in zip(fast, corpus)
+        if confidence >= NAME_CONFIDENCE_THRESHOLD
+    ]
+    correct = sum(name.lower() == truth.lower() for name, truth in confident)
+    print(f"{DOCS} resumes of {PAGES} pages, confidence threshold {NAME_CONFIDENCE_THRESHOLD}")
+    print(f"skip spaCy: {len(confident) / DOCS:.1%} ({correct}/{len(confident)} correct)")
+
+    def fast_path(doc):
+        email = parser._extract_email(doc.header.text)
+        return detect_name(doc.sections.header or doc.lines, email)
+
+    print(f"{'step':>22} {'ms/resume':>10}")
+    docs = [Document(text) for text, _ in corpus]
+    print(f"{'fast path only':>22} {_ms_per_doc(fast_path, docs):>10.3f}")
+
+    assistant = get_spacy_assistant()
+    if not assistant.is_available():
+        print("spaCy model not installed: skipping the NER comparison")
+        return
+
+    def always_ner(doc):
+        return assistant.extract_name_with_ner(parser._ner_text(doc))
+
+    def fast_then_ner(doc):
+        name, confidence = fast_path(doc)
+        return name if confidence >= NAME_CONFIDENCE_THRESHOLD else always_ner(doc)
+
+    always_ner(Document(corpus[0][0]))  # warm up outside the timings
+    for label, fn in [("always NER", always_ner), ("fast path + NER", fast_then_ner)]:
+        docs = [Document(text) for text, _ in corpus]
+        print(f"{label:>22} {_ms_per_doc(fn, docs):>10.3f}")
+
+    # Whole parse, bypassing PROFILE_CACHE; a threshold above 1 forces NER
+    for label, threshold in [("parse, always NER", 1.1), ("parse, fast path", NAME_CONFIDENCE_THRESHOLD)]:
+        resume_parser.NAME_CONFIDENCE_THRESHOLD = threshold
+        docs = [Document(text) for text, _ in corpus]
+        ms = _ms_per_doc(lambda doc: parser._parse_document(doc, vocabulary), docs)
+        print(f"{label:>22} {ms:>10.3f}")
+    resume_parser.NAME_CONFIDENCE_THRESHOLD = NAME_CONFIDENCE_THRESHOLD
+
+
+if __name__ == "__main__":
+    main()
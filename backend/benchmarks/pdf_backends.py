@@ -0,0 +1,54 @@
+"""
+Throughput and text parity of the PDF backends on generated resume PDFs.
+
+Parity is the ``difflib`` similarity of each backend's text to pdfplumber's
+(whitespace-normalised), so a fast backend that drops or reorders content
+shows up next to its speed-up.
+
+Run from the repository root:
+
+    python -m backend.benchmarks.pdf_backends
+"""
+
+import difflib
+import time
+
+from ..services.pdf_backends import BACKENDS, FALLBACK_BACKEND
+from ._pdf import make_resume_pdf
+
+
+PAGE_COUNTS = [1, 2, 5, 20]
+FIXTURES_PER_SIZE = 3
+
+
+def _normalised(pages) -> str:
+    return " ".join("\n".join(pages).split())
+
+
+def main() -> None:
+    corpus = {
+        pages: [make_resume_pdf(pages, seed) for seed in range(FIXTURES_PER_SIZE)]
+        for pages in PAGE_COUNTS
+    }
+    backends = [b for b in BACKENDS.values() if b.is_available()]
+
+    print(f"{'backend':>11} {'pages':>6} {'ms/doc':>8} {'pages/s':>8} {'parity':>7}")
+    for pages, fixtures in corpus.items():
+        reference = [_normalised(FALLBACK_BACKEND.iter_pages(f)) for f in fixtures]
+        for backend in backends:
+            start = time.perf_counter()
+            texts = [list(backend.iter_pages(f)) for f in fixtures]
+            elapsed = (time.perf_counter() - start) / len(fixtures)
+            parity = min(
+                difflib.SequenceMatcher(None, _normalised(text), ref).ratio()
+                for text, ref in zip(texts, reference)
+            )
+            print(
+                f"{backend.name:>11} {pages:>6} {elapsed * 1000:>8.1f} "
+                f"{pages / elapsed:>8.0f} {parity:>7.3f}"
+            )
+        print()
+
+
+if __name__ == "__main__":
+    main()
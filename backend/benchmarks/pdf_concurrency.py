@@ -0,0 +1,110 @@
+"""
+Load test: latency of small TXT uploads while large PDFs are being parsed.
+
+Runs the app in-process through httpx's ASGI transport, first with PDF
+extraction inline on the event loop (PDF_WORKERS=0, the old behaviour) and
+then with the process pool. Needs ``httpx``. Run from the repository root:
+
+    python -m backend.benchmarks.pdf_concurrency
+"""
+
+import asyncio
+import statistics
+import time
+from typing import List
+
+import httpx
+
+from ..main import create_app
+from ..services import pdf_extraction
+from ..services.resume_parser import PROFILE_CACHE, TEXT_CACHE
+from ._corpus import resume_text
+from ._pdf import make_resume_pdf
+
+
+LARGE_PDF_PAGES = 20
+CONCURRENT_PDFS = 4
+TXT_REQUESTS = 200
+TXT_INTERVAL = 0.01
+
+
+def _percentile(samples, pct: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * pct / 100))]
+
+
+async def _run(workers: int, pdfs: List[bytes], txt: bytes) -> dict:
+    # Every mode starts cold, so each PDF really is extracted
+    TEXT_CACHE.memory.clear()
+    PROFILE_CACHE.clear()
+    pdf_extraction.shutdown_pdf_pool()
+    pdf_extraction.PDF_WORKERS = workers
+    pdf_extraction.start_pdf_pool()
+
+    transport = httpx.ASGITransport(app=create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+
+        async def upload_pdf(pdf):
+            r = await client.post(
+                "/api/parse-resume", files={"file": ("big.pdf", pdf)}, timeout=None
+            )
+            r.raise_for_status()
+
+        async def upload_txt(latencies, scheduled):
+            r = await client.post("/api/parse-resume", files={"file": ("cv.txt", txt)})
+            r.raise_for_status()
+            latencies.append(time.perf_counter() - scheduled)
+
+        # Baseline without PDF load
+        idle = []
+        for _ in range(20):
+            await upload_txt(idle, time.perf_counter())
+
+        # Open-loop load: latency counts from when each request was *due*, so
+        # time spent waiting for a blocked event loop is included.
+        latencies = []
+        start = time.perf_counter()
+        pdf_tasks = [asyncio.create_task(upload_pdf(pdf)) for pdf in pdfs]
+        txt_tasks = []
+        for i in range(TXT_REQUESTS):
+            due = start + i * TXT_INTERVAL
+            await asyncio.sleep(max(0.0, due - time.perf_counter()))
+            txt_tasks.append(asyncio.create_task(upload_txt(latencies, due)))
+        await asyncio.gather(*txt_tasks)
+        await asyncio.gather(*pdf_tasks)
+        wall = time.perf_counter() - start
+
+    pdf_extraction.shutdown_pdf_pool()
+    return {
+        "idle_p99": _percentile(idle, 99),
+        "p50": statistics.median(latencies),
+        "p99": _percentile(latencies, 99),
+        "max": max(latencies),
+        "wall": wall,
+    }
+
+
+def main() -> None:
+    # Distinct files, or all but the first would be text cache hits
+    pdfs = [make_resume_pdf(LARGE_PDF_PAGES, seed=i) for i in range(CONCURRENT_PDFS)]
+    txt = resume_text(3_000).encode()
+    # Measure extraction, not a disk tier left over from earlier runs
+    TEXT_CACHE.disk = None
+    print(
+        f"{CONCURRENT_PDFS} x {LARGE_PDF_PAGES}-page PDFs alongside "
+        f"{TXT_REQUESTS} small TXT uploads"
+    )
+    print(
+        f"{'mode':>12} {'idle p99 ms':>12} {'p50 ms':>8} {'p99 ms':>8}"
+        f" {'max ms':>8} {'wall s':>7}"
+    )
+    for label, workers in (("inline", 0), ("pool", pdf_extraction.PDF_WORKERS or 4)):
+        r = asyncio.run(_run(workers, pdfs, txt))
+        print(
+            f"{label:>12} {r['idle_p99'] * 1e3:>12.1f} {r['p50'] * 1e3:>8.1f}"
+            f" {r['p99'] * 1e3:>8.1f} {r['max'] * 1e3:>8.1f} {r['wall']:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Wall-clock speed-up of per-page parallel extraction by worker count.
+
+Long PDFs are split into page ranges across 1, 2, 4 and "all cores" pool
+workers and timed per backend. Page and time budgets are
+disabled so every page is extracted. Speed-up is relative to one worker;
+on a single-core machine expect none.
+
+Run from the repository root:
+
+    python -m backend.benchmarks.pdf_parallel
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+from ..services.pdf_backends import BACKENDS
+from ..services.pdf_extraction import _ping, extract_pdf_text_parallel
+from ._pdf import make_resume_pdf
+from ._timing import best_of_async
+
+
+PAGE_COUNTS = [40, 120]
+REPEAT = 3
+
+
+def _worker_counts():
+    return sorted({1, 2, 4, os.cpu_count() or 1})
+
+
+def main() -> None:
+    # Inherited by the spawned workers
+    os.environ["PDF_MAX_PAGES"] = "0"
+    os.environ["PDF_TIME_BUDGET"] = "0"
+    fixtures = {pages: make_resume_pdf(pages) for pages in PAGE_COUNTS}
+    backends = [n for n in ("pdfium", "pdfplumber") if BACKENDS[n].is_available()]
+    baselines = {}
+    print(f"cores: {os.cpu_count()}")
+    print(f"{'backend':>11} {'pages':>6} {'workers':>8} {'ms':>9} {'speed-up':>9}")
+
+    for name in backends:
+        os.environ["PDF_BACKEND"] = name
+        for workers in _worker_counts():
+            pool = ProcessPoolExecutor(
+                max_workers=workers, mp_context=multiprocessing.get_context("spawn")
+            )
+            for future in [pool.submit(_ping) for _ in range(workers)]:
+                future.result()
+            for pages, raw_bytes in fixtures.items():
+                elapsed = asyncio.run(
+                    best_of_async(
+                        lambda: extract_pdf_text_parallel(raw_bytes, pool, workers, pages),
+                        REPEAT,
+                    )
+                )
+                baseline = baselines.setdefault((name, pages), elapsed)
+                print(
+                    f"{name:>11} {pages:>6} {workers:>8} {elapsed * 1000:>9.1f} "
+                    f"{baseline / elapsed:>8.2f}x"
+                )
+            pool.shutdown()
+        print()
+
+
+if __name__ == "__main__":
+    main()
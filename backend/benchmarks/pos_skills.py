@@ -0,0 +1,77 @@
+"""
+POS-filtered skill detection: the old nested loops (every noun chunk and
+noun token against every skill) vs the compiled PhraseMatcher, at 130, 5k
+and 50k skills. Both work on the same parsed Doc, so only matching is timed;
+PhraseMatcher compile time is reported apart.
+
+Needs the spaCy model (``python -m spacy download en_core_web_sm``, or point
+SPACY_MODEL at another one). Run from the repository root:
+
+    python -m backend.benchmarks.pos_skills
+"""
+
+import time
+
+from ..services.spacy_assistant import SPACY_MODEL, SpacyAssistant
+from ._corpus import resume_text
+from .vocabulary_scaling import synthetic_vocabulary
+
+
+VOCAB_SIZES = [130, 5_000, 50_000]
+# Above this the nested loops take minutes per document
+LOOP_MAX_VOCAB = 5_000
+DOC_CHARS = 10_000
+
+
+def nested_loops(doc, skill_keywords):
+    """The previous implementation of ``extract_skills_with_pos``."""
+    detected = set()
+    for chunk in doc.noun_chunks:
+        chunk_text = chunk.text.lower().strip()
+        for skill in skill_keywords:
+            if skill.lower() in chunk_text or chunk_text in skill.lower():
+                detected.add(skill)
+    for token in doc:
+        if token.pos_ in ["NOUN", "PROPN"] and not token.is_stop:
+            token_text = token.text.lower().strip()
+            for skill in skill_keywords:
+                if skill.lower() == token_text or skill.lower() in token_text:
+                    detected.add(skill)
+    return sorted(detected)
+
+
+def main() -> None:
+    assistant = SpacyAssistant()
+    if not assistant.is_available():
+        raise SystemExit(f"spaCy model {SPACY_MODEL!r} is not installed")
+    doc = assistant.parse(resume_text(DOC_CHARS))
+
+    print(f"{DOC_CHARS} character document, {len(doc)} tokens")
+    print(
+        f"{'skills':>7} {'loops ms':>9} {'compile ms':>11} {'matcher ms':>11}"
+        f" {'found':>6}"
+    )
+    for size in VOCAB_SIZES:
+        skills = sorted(synthetic_vocabulary(size))
+
+        start = time.perf_counter()
+        assistant.skill_phrase_matcher(skills)
+        compile_s = time.perf_counter() - start
+
+        start = time.perf_counter()
+        found = assistant.extract_skills_with_pos(doc, skills)
+        matcher_s = time.perf_counter() - start
+
+        loops = "-"
+        if size <= LOOP_MAX_VOCAB:
+            start = time.perf_counter()
+            nested_loops(doc, skills)
+            loops = f"{(time.perf_counter() - start) * 1000:.1f}"
+        print(
+            f"{size:>7} {loops:>9} {compile_s * 1000:>11.1f}"
+            f" {matcher_s * 1000:>11.2f} {len(found):>6}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,53 @@
+"""
+Throughput of the compiled skill matcher versus the old per-skill regex loop.
+
+Run from the repository root:
+
+    python -m backend.benchmarks.skill_matcher
+"""
+
+import re
+
+from ..utils.skills_db import NORMALISED_SKILLS, get_vocabulary
+from ._corpus import resume_text
+from ._timing import best_of
+
+
+DOC_SIZES = [1_000, 5_000, 20_000, 100_000, 500_000]
+
+
+def regex_loop(text: str, vocabulary=NORMALISED_SKILLS) -> set:
+    """The original one-regex-per-skill scan, kept as the baseline."""
+    text_lower = text.lower()
+    detected = set()
+    for vocab_skill in vocabulary:
+        if re.search(r"\b" + re.escape(vocab_skill) + r"\b", text_lower):
+            detected.add(vocab_skill)
+    return detected
+
+
+def main() -> None:
+    matcher = get_vocabulary().matcher
+    print(f"vocabulary: {len(NORMALISED_SKILLS)} skills, matcher size {len(matcher)}")
+    print(f"{'chars':>9} {'regex ms':>10} {'compiled ms':>13} {'MB/s':>7}")
+    for size in DOC_SIZES:
+        text = resume_text(size)
+        repeat = max(3, 2_000_000 // size)
+        regex_s = best_of(lambda: regex_loop(text), repeat)
+        auto_s = best_of(lambda: matcher.find_all(text), repeat)
+        mb_s = len(text) / auto_s / 1e6
+        print(
+            f"{len(text):>9} {regex_s * 1e3:>10.2f} {auto_s * 1e3:>13.2f} {mb_s:>7.2f}"
+        )
+
+    sample = "Skills: C++, C#, Node.js, CI/CD, .NET and MySQL (not sql)."
+    print()
+    print("boundary check:", sample)
+    print("  regex    :", sorted(regex_loop(sample)))
+    vocabulary = get_vocabulary()
+    found = vocabulary.bits_to_skills(vocabulary.find_skill_bits(sample))
+    print("  compiled :", sorted(found))
+
+
+if __name__ == "__main__":
+    main()
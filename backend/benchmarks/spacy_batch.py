@@ -0,0 +1,64 @@
+"""
+Documents per second: one ``nlp(text)`` call per document vs the batched
+``nlp.pipe`` APIs, for name NER (``extract_names``) and for the full
+pipeline (``parse_many``), across batch sizes and process counts.
+
+Needs the spaCy model (``python -m spacy download en_core_web_sm``, or point
+SPACY_MODEL at another one). Run from the repository root:
+
+    python -m backend.benchmarks.spacy_batch
+"""
+
+import os
+import time
+
+from ..services.spacy_assistant import NAME_WINDOWS, SPACY_MODEL, SpacyAssistant
+from ._corpus import long_resume
+
+
+DOCS = 200
+PAGES = 2
+BATCH_SIZES = [8, 32, 128]
+N_PROCESS = sorted({1, min(2, os.cpu_count() or 1)})
+
+
+def _docs_per_second(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return DOCS / (time.perf_counter() - start)
+
+
+def main() -> None:
+    assistant = SpacyAssistant()
+    if not assistant.is_available():
+        raise SystemExit(f"spaCy model {SPACY_MODEL!r} is not installed")
+    texts = [long_resume(PAGES, seed) for seed in range(DOCS)]
+    assistant.nlp  # load the full pipeline outside the timings
+
+    def full_batch(batch_size, n_process):
+        # parse_many would otherwise serve repeats from the Doc cache
+        assistant._docs.clear()
+        assistant.parse_many(texts, batch_size, n_process)
+
+    tasks = {
+        "name": (
+            lambda: [assistant.extract_name_with_ner(t) for t in texts],
+            lambda b, p: assistant.extract_names(texts, b, p),
+        ),
+        "full": (lambda: [assistant.nlp(t) for t in texts], full_batch),
+    }
+
+    print(f"{DOCS} resumes of {PAGES} pages")
+    print(f"{'task':>5} {'mode':>22} {'docs/s':>8}")
+    for task, (loop, batched) in tasks.items():
+        print(f"{task:>5} {'per-document loop':>22} {_docs_per_second(loop):>8.1f}")
+        for n_process in N_PROCESS:
+            for batch_size in BATCH_SIZES:
+                rate = _docs_per_second(lambda: batched(batch_size, n_process))
+                mode = f"pipe b={batch_size} p={n_process}"
+                print(f"{task:>5} {mode:>22} {rate:>8.1f}")
+    print(f"(name NER reads the first {NAME_WINDOWS[0]} chars, retrying on more)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Per-resume name-extraction latency and resident memory: full spaCy pipeline
+over 50k characters (the old path) vs the NER-only pipeline over a short
+header window.
+
+Each variant runs in a fresh interpreter so their RSS figures don't mix.
+Needs the spaCy model (``python -m spacy download en_core_web_sm``, or point
+SPACY_MODEL at another one). Run from the repository root:
+
+    python -m backend.benchmarks.spacy_ner
+"""
+
+import json
+import resource
+import subprocess
+import sys
+import time
+
+from ._corpus import long_resume
+
+
+RESUMES = 20
+PAGES = 3
+FULL_PIPELINE_CHARS = 50_000
+
+
+def _rss_mib() -> float:
+    # ru_maxrss is KiB on Linux
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def _run_variant(variant: str) -> dict:
+    from ..services.spacy_assistant import SPACY_MODEL, SpacyAssistant
+
+    baseline = _rss_mib()
+    start = time.perf_counter()
+    if variant == "full":
+        import spacy
+
+        nlp = spacy.load(SPACY_MODEL)
+
+        def extract(text):
+            return SpacyAssistant._best_person(nlp(text[:FULL_PIPELINE_CHARS]))
+
+    else:
+        assistant = SpacyAssistant()
+        if not assistant.is_available():
+            raise SystemExit(f"spaCy model {SPACY_MODEL!r} is not installed")
+        extract = assistant.extract_name_with_ner
+    load_s = time.perf_counter() - start
+    loaded = _rss_mib()
+
+    texts = [long_resume(PAGES, seed) for seed in range(RESUMES)]
+    extract(texts[0])
+    start = time.perf_counter()
+    names = [extract(text) for text in texts]
+    per_resume = (time.perf_counter() - start) / len(texts)
+    return {
+        "load_s": load_s,
+        "model_mib": loaded - baseline,
+        "peak_mib": _rss_mib(),
+        "ms": per_resume * 1000,
+        "found": sum(1 for name in names if name),
+    }
+
+
+def main() -> None:
+    print(f"{RESUMES} resumes of {PAGES} pages")
+    print(
+        f"{'pipeline':>9} {'load s':>7} {'model MiB':>10} {'peak MiB':>9}"
+        f" {'ms/resume':>10} {'names':>6}"
+    )
+    for variant in ("full", "ner"):
+        out = subprocess.run(
+            [sys.executable, "-m", __spec__.name, variant],
+            capture_output=True,
+            text=True,
+        )
+        if out.returncode != 0:
+            print(f"{variant:>9} failed: {out.stderr.strip().splitlines()[-1]}")
+            continue
+        r = json.loads(out.stdout)
+        print(
+            f"{variant:>9} {r['load_s']:>7.2f} {r['model_mib']:>10.1f}"
+            f" {r['peak_mib']:>9.1f} {r['ms']:>10.2f} {r['found']:>6}"
+        )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        print(json.dumps(_run_variant(sys.argv[1])))
+    else:
+        main()
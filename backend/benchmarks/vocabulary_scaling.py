@@ -0,0 +1,71 @@
+"""
+Skill detection latency as the vocabulary grows from ~130 to 100k entries.
+
+The regex loop is only timed up to a few thousand skills; beyond that it
+takes seconds per document. Run from the repository root:
+
+    python -m backend.benchmarks.vocabulary_scaling
+"""
+
+import random
+import string
+import time
+
+from ..utils.skills_db import NORMALISED_SKILLS
+from ..utils.skill_matcher import build_skill_matcher
+from ._corpus import resume_text
+from .skill_matcher import regex_loop
+from ._timing import best_of
+
+
+VOCAB_SIZES = [130, 1_000, 5_000, 20_000, 50_000, 100_000]
+REGEX_MAX_VOCAB = 5_000
+DOC_CHARS = 10_000
+
+
+def synthetic_vocabulary(size: int, seed: int = 0) -> set:
+    """The real vocabulary padded with random 1-3 word pseudo-skills."""
+    rng = random.Random(seed)
+    vocab = set(NORMALISED_SKILLS)
+    while len(vocab) < size:
+        words = [
+            "".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9)))
+            for _ in range(rng.choice((1, 1, 2, 2, 3)))
+        ]
+        vocab.add(" ".join(words))
+    return vocab
+
+
+def main() -> None:
+    text = resume_text(DOC_CHARS)
+    print(f"document: {len(text)} chars")
+    print(
+        f"{'vocab':>8} {'regex ms':>10} {'automaton ms':>13} {'ngram ms':>9}"
+        f" {'build auto s':>13} {'build ngram s':>14}"
+    )
+    for size in VOCAB_SIZES:
+        vocab = synthetic_vocabulary(size)
+
+        start = time.perf_counter()
+        automaton = build_skill_matcher(vocab, "automaton")
+        build_auto = time.perf_counter() - start
+        start = time.perf_counter()
+        ngram = build_skill_matcher(vocab, "ngram")
+        build_ngram = time.perf_counter() - start
+
+        auto_ms = best_of(lambda: automaton.find_all(text)) * 1e3
+        ngram_ms = best_of(lambda: ngram.find_all(text)) * 1e3
+        if size <= REGEX_MAX_VOCAB:
+            regex_s = best_of(lambda: regex_loop(text, vocab), repeat=1)
+            regex_ms = f"{regex_s * 1e3:>10.1f}"
+        else:
+            regex_ms = f"{'-':>10}"
+
+        print(
+            f"{len(vocab):>8} {regex_ms} {auto_ms:>13.2f} {ngram_ms:>9.2f}"
+            f" {build_auto:>13.2f} {build_ngram:>14.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
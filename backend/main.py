@@ -1,7 +1,55 @@
+import asyncio
+import logging
+import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
+
+from .routes import admin, parse, match
+from .services.container import Services
+from .services.pdf_extraction import shutdown_pdf_pool, start_pdf_pool
+from .services.resume_parser import TEXT_CACHE
+from .services.uploads import UploadSizeLimitMiddleware
+from .utils.skills_db import SKILLS_VOCAB_PATH, VocabularyWatcher
+
+
+logger = logging.getLogger(__name__)
+
+
+async def _warm_up(services: Services) -> None:
+    try:
+        await run_in_threadpool(services.warm_up)
+    except Exception:
+        # Leaves the app unready, so /health keeps reporting it
+        logger.exception("Service warm-up failed")
+
 
-from .routes import parse, match
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Long-lived PDF extraction workers, started before the first request
+    await run_in_threadpool(start_pdf_pool)
+    # Expired resume text from earlier runs is removed even if never re-read
+    if TEXT_CACHE.disk is not None:
+        await run_in_threadpool(TEXT_CACHE.disk.prune)
+    # Model loading and warm-up run in the background: the server accepts
+    # connections right away and /health reports ready once they finish.
+    warm_up = asyncio.create_task(_warm_up(app.state.services))
+    # Optional hot reload of an external skill vocabulary file
+    watcher = None
+    watch_interval = float(os.getenv("SKILLS_VOCAB_WATCH_INTERVAL", "0"))
+    if SKILLS_VOCAB_PATH and watch_interval > 0:
+        watcher = VocabularyWatcher(SKILLS_VOCAB_PATH, watch_interval)
+        watcher.start()
+    try:
+        yield
+    finally:
+        if watcher is not None:
+            watcher.stop()
+        warm_up.cancel()
+        shutdown_pdf_pool()
 
 
 def create_app() -> FastAPI:
@@ -13,8 +61,13 @@ def create_app() -> FastAPI:
         title="Smart Resume Parser + Role Match API",
         description="Hackathon-grade API for parsing resumes and matching them to job descriptions.",
         version="1.0.0",
+        lifespan=lifespan,
     )
+    # Parsers, match engine and spaCy model shared by every router
+    app.state.services = Services()
 
+    # Added before CORS so that 413 responses still carry CORS headers
+    app.add_middleware(UploadSizeLimitMiddleware)
     app.add_middleware(
         CORSMiddleware,
         allow_origins=["*"],
@@ -25,10 +78,16 @@ def create_app() -> FastAPI:
 
     app.include_router(parse.router, prefix="/api")
     app.include_router(match.router, prefix="/api")
+    app.include_router(admin.router, prefix="/api")
 
     @app.get("/health")
     async def health_check():
-        return {"status": "ok"}
+        """Readiness: 503 until the models are loaded and warmed up."""
+        if not app.state.services.ready:
+            return JSONResponse(
+                status_code=503, content={"status": "starting", "ready": False}
+            )
+        return {"status": "ok", "ready": True}
 
     return app
 
@@ -0,0 +1,72 @@
+import hmac
+import os
+
+from fastapi import APIRouter, Depends, Header, HTTPException
+
+from ..services.resume_parser import PROFILE_CACHE, TEXT_CACHE
+from ..utils.skills_db import (
+    get_vocabulary,
+    notify_vocabulary_watchers,
+    reload_vocabulary,
+)
+
+
+router = APIRouter(prefix="/admin", tags=["Admin"])
+
+
+def require_admin_token(x_admin_token: str | None = Header(None)) -> None:
+    """
+    Admin routes are disabled unless ADMIN_TOKEN is set, and then require it
+    in the X-Admin-Token header.
+    """
+    expected = os.getenv("ADMIN_TOKEN")
+    if not expected:
+        raise HTTPException(status_code=403, detail="Admin API is disabled")
+    if not x_admin_token or not hmac.compare_digest(x_admin_token, expected):
+        raise HTTPException(status_code=403, detail="Invalid admin token")
+
+
+def _vocabulary_summary(vocabulary) -> dict:
+    return {
+        "version": vocabulary.version,
+        "skills": len(vocabulary),
+        "surface_forms": len(vocabulary.lookup),
+    }
+
+
+@router.get("/skills", dependencies=[Depends(require_admin_token)])
+async def skill_vocabulary_info():
+    """Version and size of the skill vocabulary currently in use."""
+    return _vocabulary_summary(get_vocabulary())
+
+
+@router.post("/skills/reload", dependencies=[Depends(require_admin_token)])
+def reload_skill_vocabulary():
+    """
+    Recompile the skill vocabulary from SKILLS_VOCAB_PATH and swap it in.
+
+    The request reaches a single worker process. After a successful reload
+    the file is touched so the vocabulary watchers of the other workers
+    reload it too. Without SKILLS_VOCAB_WATCH_INTERVAL no worker runs a
+    watcher, so only the one that served this request changes.
+
+    Declared sync so FastAPI runs the compile in its threadpool instead of
+    on the event loop. In-flight requests keep the vocabulary they started with.
+    """
+    try:
+        vocabulary = reload_vocabulary()
+    except (OSError, ValueError) as e:
+        raise HTTPException(status_code=400, detail=f"Vocabulary reload failed: {e}")
+    return {
+        **_vocabulary_summary(vocabulary),
+        "workers_notified": notify_vocabulary_watchers(),
+    }
+
+
+@router.get("/cache", dependencies=[Depends(require_admin_token)])
+async def cache_stats():
+    """Hit, miss and eviction counters of the parsing caches."""
+    return {
+        "resume_text": TEXT_CACHE.stats(),
+        "profiles": PROFILE_CACHE.stats(),
+    }
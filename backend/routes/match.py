@@ -1,22 +1,51 @@
-from fastapi import APIRouter, UploadFile, File, Form, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException
+from starlette.concurrency import run_in_threadpool
 
-from ..services.resume_parser import ResumeParser
-from ..services.jd_parser import JobDescriptionParser
-from ..services.matcher import MatchEngine
+from ..services.container import Services, get_services
+from ..services.document import Document
+from ..services.pdf_backends import TextlessPdfError
+from ..services.uploads import UploadTooLargeError
 from ..models.schemas import MatchResponse
+from ..utils.skills_db import SkillVocabulary, get_vocabulary
 
 
 router = APIRouter(tags=["Matching"])
 
-parser = ResumeParser()
-jd_parser = JobDescriptionParser()
-engine = MatchEngine()
+
+def _match(
+    services: Services,
+    resume_text: str,
+    job_description: str,
+    vocabulary: SkillVocabulary,
+) -> MatchResponse:
+    resume_doc = Document(resume_text)
+    jd_doc = Document(job_description)
+    candidate_profile = services.parser.parse_profile(resume_doc, vocabulary)
+
+    # Skill sets as bitsets from the scans cached on each document, so the
+    # overlap is one AND + popcount with no name round-trip
+    result = services.engine.compute_match(
+        resume_text=resume_text,
+        job_description=job_description,
+        vocabulary=vocabulary,
+        candidate_bits=services.parser.extract_skill_bits(resume_doc, vocabulary),
+        jd_bits=services.jd_parser.extract_required_skill_bits(jd_doc, vocabulary),
+    )
+
+    return MatchResponse(
+        candidate_profile=candidate_profile,
+        match_score=result.match_score,
+        matched_skills=result.matched_skills,
+        semantic_similarity=result.semantic_similarity,
+        skill_match_percentage=result.skill_match_percentage,
+    )
 
 
 @router.post("/match", response_model=MatchResponse)
 async def match_resume_to_jd(
     file: UploadFile = File(...),
     job_description: str = Form(..., description="Raw Job Description text"),
+    services: Services = Depends(get_services),
 ):
     """
     Compute an intelligent match score between a resume and a job description.
@@ -24,24 +53,23 @@ async def match_resume_to_jd(
     if not job_description.strip():
         raise HTTPException(status_code=400, detail="Job description cannot be empty")
 
+    # Pin one vocabulary for the whole request so a concurrent reload
+    # cannot mix skill ids from two versions.
+    vocabulary = get_vocabulary()
+
     try:
-        resume_text = await parser.extract_text(file)
-        candidate_profile = parser.parse_profile(resume_text)
-        jd_skills = jd_parser.extract_required_skills(job_description)
-
-        result = engine.compute_match(
-            resume_text=resume_text,
-            job_description=job_description,
-            candidate_skills=candidate_profile.skills,
-            jd_skills=jd_skills,
+        resume_text = await services.parser.extract_text(file)
+        # CPU bound, and may wait for the spaCy model while warm-up loads it
+        return await run_in_threadpool(
+            _match, services, resume_text, job_description, vocabulary
         )
-
-        return MatchResponse(
-            candidate_profile=candidate_profile,
-            match_score=result.match_score,
-            matched_skills=result.matched_skills,
-            semantic_similarity=result.semantic_similarity,
-            skill_match_percentage=result.skill_match_percentage,
+    except TextlessPdfError as e:
+        raise HTTPException(
+            status_code=422, detail={"code": e.code, "message": str(e)}
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=413, detail={"code": e.code, "message": str(e)}
         )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -1,24 +1,38 @@
-from fastapi import APIRouter, UploadFile, File, HTTPException
+from fastapi import APIRouter, Depends, UploadFile, File, HTTPException
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 
-from ..services.resume_parser import ResumeParser
+from ..services.document import Document
+from ..services.pdf_backends import TextlessPdfError
+from ..services.container import Services, get_services
+from ..services.uploads import UploadTooLargeError
 from ..models.schemas import ParseResumeResponse
 
 
 router = APIRouter(tags=["Parsing"])
 
-parser = ResumeParser()
-
 
 @router.post("/parse-resume", response_model=ParseResumeResponse)
-async def parse_resume(file: UploadFile = File(...)):
+async def parse_resume(
+    file: UploadFile = File(...),
+    services: Services = Depends(get_services),
+):
     """
     Parse a resume (PDF or TXT) and return a structured candidate profile.
     """
     try:
-        text = await parser.extract_text(file)
-        profile = parser.parse_profile(text)
+        text = await services.parser.extract_text(file)
+        # CPU bound, and may wait for the spaCy model while warm-up loads it
+        profile = await run_in_threadpool(services.parser.parse_profile, Document(text))
         return ParseResumeResponse(candidate_profile=profile)
+    except TextlessPdfError as e:
+        raise HTTPException(
+            status_code=422, detail={"code": e.code, "message": str(e)}
+        )
+    except UploadTooLargeError as e:
+        raise HTTPException(
+            status_code=413, detail={"code": e.code, "message": str(e)}
+        )
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e))
     except Exception:
@@ -0,0 +1,90 @@
+"""
+Long-lived services shared by every router.
+
+``create_app`` builds one ``Services`` container and stores it on
+``app.state``; routes receive it through ``Depends(get_services)`` instead of
+constructing their own parsers at import time. The spaCy model is the
+process-wide ``get_spacy_assistant()`` instance. The app lifespan loads it
+and runs a warm-up resume and JD through the whole pipeline, so the first
+real request doesn't pay for model loading, vocabulary scans or lazily
+compiled regexes. ``ready`` flips once warm-up is done and backs the
+readiness check on ``/health``. Routes run parsing in the threadpool, so a
+request arriving mid warm-up waits for the model there, not on the event
+loop.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+
+from fastapi import Request
+
+from .document import Document
+from .jd_parser import JobDescriptionParser
+from .matcher import MatchEngine
+from .resume_parser import ResumeParser
+from .spacy_assistant import get_spacy_assistant
+
+
+logger = logging.getLogger(__name__)
+
+WARM_UP_RESUME = """Jane Doe
+jane.doe@example.com | +1 555 123 4567
+
+Skills
+Python, FastAPI, React, Docker, PostgreSQL
+
+Experience
+Software Engineer, ABC Corp (2021 - Present)
+- Built REST APIs in Python and FastAPI
+
+Education
+B.Tech in Computer Science, XYZ University
+
+Certifications
+AWS Certified Solutions Architect
+"""
+
+WARM_UP_JD = (
+    "We are hiring a backend engineer with strong Python and FastAPI skills. "
+    "Experience with Docker and PostgreSQL is required."
+)
+
+
+@dataclass
+class Services:
+    parser: ResumeParser = field(default_factory=ResumeParser)
+    jd_parser: JobDescriptionParser = field(default_factory=JobDescriptionParser)
+    engine: MatchEngine = field(default_factory=MatchEngine)
+    ready: bool = False
+
+    def warm_up(self) -> None:
+        """
+        Load the spaCy model and push a sample resume and JD through every
+        stage. Blocking: call it from a worker thread.
+        """
+        started = time.perf_counter()
+        assistant = get_spacy_assistant()
+        if assistant.is_available():
+            # The sample's name passes the rule-based fast path, so run the
+            # first NER inference here rather than on a real resume
+            assistant.extract_name_with_ner(WARM_UP_RESUME)
+        profile = self.parser.parse_profile(Document(WARM_UP_RESUME))
+        jd_skills = self.jd_parser.extract_required_skills(Document(WARM_UP_JD))
+        self.engine.compute_match(
+            resume_text=WARM_UP_RESUME,
+            job_description=WARM_UP_JD,
+            candidate_skills=profile.skills,
+            jd_skills=jd_skills,
+        )
+        self.ready = True
+        logger.info(
+            "Services warmed up in %.2fs (spaCy %s)",
+            time.perf_counter() - started,
+            "loaded" if assistant.is_available() else "unavailable",
+        )
+
+
+def get_services(request: Request) -> Services:
+    """FastAPI dependency returning the app's shared services."""
+    return request.app.state.services
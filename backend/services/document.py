@@ -0,0 +1,52 @@
+"""
+Shared per-request document with lazily computed, cached derivations.
+
+Parsing a resume or JD needs the same derived data in several places
+(stripped lines, lower-cased text, sections, skill scans). A ``Document``
+computes each of them on first access and then reuses it, so every
+derivation happens at most once per document.
+"""
+
+from functools import cached_property
+from typing import Dict, List
+
+from ..utils.skill_matcher import SkillOccurrences, lower_aligned
+from ..utils.skills_db import SkillVocabulary
+from .section_segmenter import ResumeSections, segment_resume
+
+
+class Document:
+    def __init__(self, text: str) -> None:
+        self.text = text
+        self._skill_occurrences: Dict[str, SkillOccurrences] = {}
+
+    @cached_property
+    def lines(self) -> List[str]:
+        """Stripped, non-empty lines."""
+        return [l.strip() for l in self.text.splitlines() if l.strip()]
+
+    @cached_property
+    def lower(self) -> str:
+        """Lower-cased text with the same character offsets as ``text``."""
+        return lower_aligned(self.text)
+
+    @cached_property
+    def sections(self) -> ResumeSections:
+        return segment_resume(self.lines)
+
+    @cached_property
+    def header(self) -> "Document":
+        """The block above the first section heading, as its own document."""
+        return Document("\n".join(self.sections.header))
+
+    def skill_occurrences(self, vocabulary: SkillVocabulary) -> SkillOccurrences:
+        """Skill scan of this document, cached per vocabulary version."""
+        occurrences = self._skill_occurrences.get(vocabulary.fingerprint)
+        if occurrences is None:
+            occurrences = vocabulary.scan(self.text, lowered=self.lower)
+            self._skill_occurrences[vocabulary.fingerprint] = occurrences
+        return occurrences
+
+
+def as_document(text_or_doc: "str | Document") -> Document:
+    return text_or_doc if isinstance(text_or_doc, Document) else Document(text_or_doc)
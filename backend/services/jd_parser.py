@@ -1,6 +1,7 @@
-from typing import List
+from typing import List, Optional
 
-from ..utils.skills_db import NORMALISED_SKILLS
+from ..utils.skills_db import SkillVocabulary, get_vocabulary
+from .document import Document, as_document
 
 
 class JobDescriptionParser:
@@ -9,7 +10,11 @@ class JobDescriptionParser:
     using a shared vocabulary with the resume parser.
     """
 
-    def extract_required_skills(self, jd_text: str) -> List[str]:
+    def extract_required_skills(
+        self,
+        jd_text: "str | Document",
+        vocabulary: Optional[SkillVocabulary] = None,
+    ) -> List[str]:
         """
         Extract required skills from the raw JD text.
 
@@ -17,16 +22,23 @@ class JobDescriptionParser:
         skill vocabulary so the computed skill‑match percentage reflects real,
         explicit requirements in the JD.
         """
-        import re
-
-        text_lower = jd_text.lower()
-        detected = set()
-        for vocab_skill in NORMALISED_SKILLS:
-            # Use word boundaries to avoid partial matches (e.g. "sql" in "mysql")
-            pattern = r"\b" + re.escape(vocab_skill) + r"\b"
-            if re.search(pattern, text_lower):
-                detected.add(vocab_skill)
-
+        vocabulary = vocabulary or get_vocabulary()
+        bits = self.extract_required_skill_bits(jd_text, vocabulary)
+        detected = vocabulary.bits_to_skills(bits)
         return sorted({skill.title() for skill in detected})
 
-
+    def extract_required_skill_bits(
+        self,
+        jd_text: "str | Document",
+        vocabulary: Optional[SkillVocabulary] = None,
+    ) -> int:
+        """
+        Same detection as ``extract_required_skills`` but returned as a skill-id
+        bitset (see ``SkillVocabulary.skills_to_bits``) for fast overlap scoring.
+        """
+        # One scan with the shared compiled matcher; matches must sit on word
+        # boundaries so e.g. "sql" is not found inside "mysql".
+        # The scan is cached on the document, so asking for both the list and
+        # the bitset of one JD only scans it once.
+        doc = as_document(jd_text)
+        return doc.skill_occurrences(vocabulary or get_vocabulary()).bits()
@@ -0,0 +1,175 @@
+"""
+Single-pass keyword classifier for education, experience and certification lines.
+
+Every keyword list is compiled into one trie-shaped regex that runs once
+over the whole document; each hit is mapped back to its line with a bisect
+over line offsets. The regex sits in a lookahead, so the longest keyword
+starting at *every* position is found, including inside an earlier hit
+("mbanalyst" is both "mba" and "analyst"). Each keyword also carries the
+categories of every keyword it contains ("bachelors" also counts as
+"bachelor"), so the result is the same as testing each list separately.
+"""
+
+import re
+from bisect import bisect_right
+from typing import Dict, List, Set, Tuple
+
+from ..utils.skill_matcher import lower_aligned
+from .section_segmenter import ResumeSections
+
+
+EDUCATION = 1
+JOB = 2  # role keywords and duration markers that mark an experience entry
+NOT_EXPERIENCE = 4  # education / summary lines to keep out of experience
+CERTIFICATION = 8
+
+KEYWORDS: Dict[int, List[str]] = {
+    EDUCATION: [
+        "b.tech",
+        "b.e",
+        "bachelor",
+        "master",
+        "msc",
+        "bsc",
+        "mba",
+        "phd",
+        "university",
+        "college",
+        "institute",
+        "bachelors",
+        "masters",
+    ],
+    JOB: [
+        "intern",
+        "internship",
+        "developer",
+        "engineer",
+        "manager",
+        "lead",
+        "architect",
+        "analyst",
+        "duration",  # e.g. "Duration: Nov 2025 – Dec 2025"
+        "worked as",
+        "work experience",
+    ],
+    NOT_EXPERIENCE: [
+        "b.tech",
+        "bachelor",
+        "b.e",
+        "cgpa",
+        "student",
+        "education",
+        "university",
+        "college",
+        "institute",
+    ],
+    CERTIFICATION: ["certification", "certified"],
+}
+
+
+class LineClassifier:
+    def __init__(self, keywords: Dict[int, List[str]] = KEYWORDS) -> None:
+        flags: Dict[str, int] = {}
+        for category, words in keywords.items():
+            for word in words:
+                flags[word] = flags.get(word, 0) | category
+        # A longer keyword hides the shorter ones it contains, so give it
+        # their categories too
+        self._flags = {
+            word: _or_all(f for other, f in flags.items() if other in word)
+            for word in flags
+        }
+        # Zero-width, so overlapping keywords are all reported
+        self._regex = re.compile("(?=(" + _trie_pattern(flags) + "))")
+
+    def line_flags(self, lines: List[str]) -> List[int]:
+        """Category bitmask of every line, from one scan of the joined lines."""
+        flags = [0] * len(lines)
+        if not lines:
+            return flags
+        starts = []
+        offset = 0
+        for line in lines:
+            starts.append(offset)
+            offset += len(line) + 1
+        joined = lower_aligned("\n".join(lines))
+        for m in self._regex.finditer(joined):
+            flags[bisect_right(starts, m.start()) - 1] |= self._flags[m.group(1)]
+        return flags
+
+    def classify(
+        self, sections: ResumeSections
+    ) -> Tuple[List[str], List[str], List[str]]:
+        """
+        Education, experience and certification entries in one pass.
+
+        Each category only takes lines from its own section, or from every
+        line when the resume has no heading for it.
+        """
+        education: List[str] = []
+        experience: List[str] = []
+        certifications: List[str] = []
+        edu_labels, exp_labels, cert_labels = (
+            self._labels_in_scope(sections, section)
+            for section in ("education", "experience", "certifications")
+        )
+        flags = self.line_flags(sections.lines)
+        for line, label, line_flags in zip(sections.lines, sections.labels, flags):
+            if not line_flags:
+                continue
+            if line_flags & EDUCATION and label in edu_labels:
+                education.append(line)
+            # Keep lines that mention job / role keywords or duration markers,
+            # unless they clearly belong to education or a summary
+            if (
+                line_flags & JOB
+                and not line_flags & NOT_EXPERIENCE
+                and label in exp_labels
+            ):
+                experience.append(line)
+            if line_flags & CERTIFICATION and label in cert_labels:
+                certifications.append(line)
+        return education, experience, certifications
+
+    @staticmethod
+    def _labels_in_scope(sections: ResumeSections, section: str) -> Set[str]:
+        """
+        Labels of the lines searched for ``section``: that section's own, or
+        every label but "heading" when the resume has no such heading, so
+        unconventional layouts lose nothing.
+        """
+        if section in sections.found:
+            return {section}
+        return set(sections.labels) - {"heading"}
+
+
+def _trie_pattern(words) -> str:
+    """
+    Regex matching any of ``words``, factored as a trie ("c(?:gpa|ollege)")
+    so the engine tests one character per branch instead of every word at
+    every position. Optional tails are greedy, so the longest word wins.
+    """
+    trie: Dict[str, dict] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def build(node: Dict[str, dict]) -> str:
+        branches = [
+            re.escape(ch) + build(child) for ch, child in sorted(node.items()) if ch
+        ]
+        if not branches:
+            return ""
+        body = "(?:" + "|".join(branches) + ")"
+        return body + "?" if "" in node else body
+
+    return build(trie)
+
+
+def _or_all(values) -> int:
+    result = 0
+    for value in values:
+        result |= value
+    return result
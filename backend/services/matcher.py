@@ -1,11 +1,13 @@
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
+import numpy as np
 from sklearn.feature_extraction.text import TfidfVectorizer
 from sklearn.metrics.pairwise import cosine_similarity
 
 from ..models.schemas import MatchEngineResult
-from ..utils.skills_db import normalise_skill
+from ..utils.skill_bitset import overlap_counts
+from ..utils.skills_db import SkillVocabulary, get_vocabulary
 
 
 @dataclass
@@ -28,22 +30,33 @@ class MatchEngine:
     - Penalises missing required skills aggressively so scores are conservative.
     """
 
-    def __init__(self) -> None:
-        self.vectorizer = TfidfVectorizer(stop_words="english")
-
     def compute_match(
         self,
         resume_text: str,
         job_description: str,
-        candidate_skills: List[str],
-        jd_skills: List[str],
+        candidate_skills: Optional[List[str]] = None,
+        jd_skills: Optional[List[str]] = None,
+        vocabulary: Optional[SkillVocabulary] = None,
+        candidate_bits: Optional[int] = None,
+        jd_bits: Optional[int] = None,
     ) -> MatchEngineResult:
+        """
+        Score a resume against a JD. Skills are given either as names or,
+        cheaper, as skill-id bitsets (``SkillOccurrences.bits()``) that the
+        caller already has; the bitsets win when both are passed.
+        """
+        vocabulary = vocabulary or get_vocabulary()
+        if candidate_bits is None:
+            candidate_bits = vocabulary.skills_to_bits(candidate_skills or [])
+        if jd_bits is None:
+            jd_bits = vocabulary.skills_to_bits(jd_skills or [])
+
         semantic_similarity = self._semantic_similarity(resume_text, job_description)
         (
             matched_skills,
             missing_skills,
             skill_match_percentage,
-        ) = self._skill_overlap(candidate_skills, jd_skills)
+        ) = self._skill_overlap(candidate_bits, jd_bits, vocabulary)
 
         # Make skill matching stricter:
         # - non‑linear curve (squaring the ratio) so partial matches score much lower
@@ -68,7 +81,10 @@ class MatchEngine:
 
     def _semantic_similarity(self, resume_text: str, job_description: str) -> float:
         corpus = [resume_text, job_description]
-        tfidf_matrix = self.vectorizer.fit_transform(corpus)
+        # A fresh vectorizer per call: fit_transform mutates the vectorizer, so
+        # one shared across threadpool requests races (mismatched features)
+        vectorizer = TfidfVectorizer(stop_words="english")
+        tfidf_matrix = vectorizer.fit_transform(corpus)
         similarity = cosine_similarity(tfidf_matrix[0:1], tfidf_matrix[1:2])[0][0]
         # Scale to percentage
         return float(similarity * 100)
@@ -111,24 +127,43 @@ class MatchEngine:
         # High overlap – trust semantic signal more
         return semantic
 
+    def skill_match_percentages(
+        self, jd_bits: int, candidate_matrix: np.ndarray
+    ) -> np.ndarray:
+        """
+        Raw skill match % of every candidate against one JD.
+
+        ``candidate_matrix`` is built once with ``skill_bitset.pack_bitsets``
+        from stored candidate bitsets, so scoring tens of thousands of
+        candidates is a single vectorised AND + popcount.
+        """
+        jd_count = jd_bits.bit_count()
+        if not jd_count:
+            return np.full(candidate_matrix.shape[0], 100.0)
+        return overlap_counts(candidate_matrix, jd_bits) * (100.0 / jd_count)
+
     def _skill_overlap(
-        self, candidate_skills: List[str], jd_skills: List[str]
+        self,
+        candidate_bits: int,
+        jd_bits: int,
+        vocabulary: SkillVocabulary,
     ) -> tuple[List[str], List[str], float]:
-        cand_norm = {normalise_skill(s) for s in candidate_skills}
-        jd_norm = {normalise_skill(s) for s in jd_skills}
-
-        if not jd_norm:
+        if not jd_bits:
             # Edge case: JD had no recognised skills
-            return sorted(candidate_skills), [], 100.0
-
-        matched_norm = cand_norm & jd_norm
-        missing_norm = jd_norm - cand_norm
+            return _skill_names(candidate_bits, vocabulary), [], 100.0
 
-        skill_match_percentage = (len(matched_norm) / len(jd_norm)) * 100 if jd_norm else 0
+        matched_bits = candidate_bits & jd_bits
+        missing_bits = jd_bits & ~candidate_bits
 
-        matched_skills = sorted({s.title() for s in matched_norm})
-        missing_skills = sorted({s.title() for s in missing_norm})
+        skill_match_percentage = matched_bits.bit_count() / jd_bits.bit_count() * 100
 
-        return matched_skills, missing_skills, float(skill_match_percentage)
+        return (
+            _skill_names(matched_bits, vocabulary),
+            _skill_names(missing_bits, vocabulary),
+            float(skill_match_percentage),
+        )
 
 
+def _skill_names(bits: int, vocabulary: SkillVocabulary) -> List[str]:
+    """Sorted, title-cased names of the skills in ``bits``."""
+    return sorted({s.title() for s in vocabulary.bits_to_skills(bits)})
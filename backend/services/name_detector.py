@@ -0,0 +1,78 @@
+"""
+Rule-based candidate name detection, the spaCy-free fast path.
+
+Scores the first header lines (or the lines around the email) on shape and
+on a first-name / surname gazetteer. A confident result is used as is; only
+low-confidence resumes are sent to spaCy NER, which is the slowest step of
+``parse_profile`` and needs the model loaded.
+"""
+
+import os
+import re
+from typing import List, Optional, Tuple
+
+from ..utils.names_db import FIRST_NAMES, SURNAMES
+
+
+# Below this the caller should ask spaCy NER instead
+NAME_CONFIDENCE_THRESHOLD = float(os.getenv("NAME_CONFIDENCE_THRESHOLD", "0.7"))
+
+# "Jane", "O'Neil", "Jean-Luc", "J." ; upper-case lines are accepted too
+_NAME_WORD = re.compile(r"[A-Z][A-Za-z'\-]*\.?$")
+_CONTACT_HINT = re.compile(r"[@\d/|:]|www\.|https?")
+
+# Words that mark a title, heading or organisation line rather than a name
+_NOT_NAME_WORDS = frozenset(
+    """
+    resume cv curriculum vitae profile summary objective contact details
+    engineer developer manager analyst scientist designer consultant intern
+    architect lead senior junior software data full stack frontend backend
+    university college institute school limited ltd inc corp technologies
+    """.split()
+)
+
+
+def _score_line(line: str, position: int, above_email: bool) -> float:
+    words = line.split()
+    if not 2 <= len(words) <= 4 or _CONTACT_HINT.search(line):
+        return 0.0
+    if not all(_NAME_WORD.match(word) for word in words):
+        return 0.0
+    lowered = [word.lower().strip(".") for word in words]
+    if any(word in _NOT_NAME_WORDS for word in lowered):
+        return 0.0
+
+    score = 0.3  # looks like a name
+    if lowered[0] in FIRST_NAMES:
+        score += 0.45
+    if lowered[-1] in SURNAMES:
+        score += 0.3
+    if position == 0:
+        score += 0.1
+    if above_email:
+        score += 0.1
+    return min(score, 1.0)
+
+
+def detect_name(lines: List[str], email: Optional[str]) -> Tuple[Optional[str], float]:
+    """
+    Best name-like line among the first header lines and its confidence in
+    ``[0, 1]``; ``(None, 0.0)`` when nothing looks like a name.
+    """
+    email_idx = None
+    if email:
+        email_idx = next((i for i, line in enumerate(lines) if email in line), None)
+
+    candidates = range(min(len(lines), 5))
+    if email_idx is not None:
+        candidates = range(max(0, email_idx - 3), email_idx)
+
+    best, best_score = None, 0.0
+    for i in candidates:
+        score = _score_line(lines[i], i, email_idx is not None and i == email_idx - 1)
+        if score > best_score:
+            best, best_score = lines[i], score
+    if best is not None and best.isupper():
+        # "JANE DOE" -> "Jane Doe"
+        best = best.title()
+    return best, best_score
@@ -0,0 +1,385 @@
+"""
+Pluggable PDF text backends.
+
+pdfplumber computes a full character layout for every page, which makes it
+accurate but slow. Most resumes are simple single-column PDFs that a faster
+extractor handles just as well, so the default backend is the fastest one
+installed (pypdfium2, then pypdf) and pdfplumber is kept as the fallback
+for documents whose fast-path text fails ``text_looks_usable``.
+
+PDF_BACKEND selects the primary backend by name; "auto" (the default) picks
+the first available from ``FAST_BACKENDS``.
+
+Pages are streamed one at a time. pypdfium2 and pdfplumber release each
+page's parser state as soon as its text is out, so memory stays flat however
+long the file is; pypdf has no per-page release and keeps the objects it has
+parsed until the whole document is closed.
+Extraction stops early after PDF_MAX_PAGES pages or PDF_TIME_BUDGET seconds
+(``0`` disables either limit); a resume's content is on its first pages.
+
+``check_text_layer`` counts the characters on the first PDF_PRECHECK_PAGES
+pages and raises ``TextlessPdfError`` for scanned / image-only files before
+any real extraction or parsing is attempted.
+"""
+
+import abc
+import io
+import logging
+import os
+import time
+import unicodedata
+from typing import BinaryIO, Dict, Iterator, List, Optional, Tuple, Union
+
+import pdfplumber
+
+try:
+    import pypdfium2
+
+    PYPDFIUM2_AVAILABLE = True
+except ImportError:
+    PYPDFIUM2_AVAILABLE = False
+
+try:
+    import pypdf
+
+    PYPDF_AVAILABLE = True
+except ImportError:
+    PYPDF_AVAILABLE = False
+
+
+logger = logging.getLogger(__name__)
+
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "30"))
+PDF_TIME_BUDGET = float(os.getenv("PDF_TIME_BUDGET", "10"))
+PDF_PRECHECK_PAGES = int(os.getenv("PDF_PRECHECK_PAGES", "2"))
+
+# Below this many non-space characters per page the text layer is assumed
+# to be missing or mangled
+MIN_CHARS_PER_PAGE = 30
+# Share of characters that may be replacement / private-use / control
+# characters or "(cid:NN)" glyph placeholders before we distrust the text
+MAX_GARBLED_RATIO = 0.05
+
+
+# PDF content in memory, or the path of a file holding it. Paths let large
+# uploads reach pool workers without copying their bytes through a pipe.
+PdfSource = Union[bytes, str]
+
+
+def _as_file(source: PdfSource) -> "BinaryIO | str":
+    return io.BytesIO(source) if isinstance(source, bytes) else source
+
+
+class TextlessPdfError(ValueError):
+    """The PDF has no usable text layer (scanned or image-only)."""
+
+    code = "pdf_no_text_layer"
+
+
+class PdfTextBackend(abc.ABC):
+    """
+    Extracts the text of a PDF page by page. ``iter_pages`` is a generator
+    over pages ``start`` to ``stop`` (exclusive, default: the last page) that
+    frees each page before moving on, where the library allows it, and the
+    document when closed.
+    """
+
+    name = "base"
+
+    def is_available(self) -> bool:
+        return True
+
+    @abc.abstractmethod
+    def page_count(self, source: PdfSource) -> int:
+        """Number of pages in the document."""
+
+    @abc.abstractmethod
+    def iter_pages(
+        self, source: PdfSource, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[str]:
+        """Text of pages ``start`` to ``stop``, one page at a time."""
+
+    def count_chars(self, source: PdfSource, max_pages: int) -> int:
+        """Non-space characters on the first ``max_pages`` pages."""
+        pages = self.iter_pages(source)
+        try:
+            return sum(
+                len(text) - sum(ch.isspace() for ch in text)
+                for _, text in zip(range(max_pages), pages)
+            )
+        finally:
+            pages.close()
+
+
+class PdfiumBackend(PdfTextBackend):
+    """PDFium's native text extraction through pypdfium2. Fastest option."""
+
+    name = "pdfium"
+
+    def is_available(self) -> bool:
+        return PYPDFIUM2_AVAILABLE
+
+    def page_count(self, source: PdfSource) -> int:
+        pdf = pypdfium2.PdfDocument(source)
+        try:
+            return len(pdf)
+        finally:
+            pdf.close()
+
+    def iter_pages(
+        self, source: PdfSource, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[str]:
+        pdf = pypdfium2.PdfDocument(source)
+        try:
+            for index in range(start, min(len(pdf), stop or len(pdf))):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                try:
+                    yield textpage.get_text_range().replace("\r\n", "\n")
+                finally:
+                    textpage.close()
+                    page.close()
+        finally:
+            pdf.close()
+
+    def count_chars(self, source: PdfSource, max_pages: int) -> int:
+        # Reads the character count off the text page without building text
+        pdf = pypdfium2.PdfDocument(source)
+        try:
+            total = 0
+            for index in range(min(max_pages, len(pdf))):
+                page = pdf[index]
+                textpage = page.get_textpage()
+                try:
+                    total += textpage.count_chars()
+                finally:
+                    textpage.close()
+                    page.close()
+            return total
+        finally:
+            pdf.close()
+
+
+class PypdfBackend(PdfTextBackend):
+    """Pure-Python pypdf; no layout analysis, much faster than pdfplumber."""
+
+    name = "pypdf"
+
+    def is_available(self) -> bool:
+        return PYPDF_AVAILABLE
+
+    def page_count(self, source: PdfSource) -> int:
+        return len(pypdf.PdfReader(_as_file(source)).pages)
+
+    def iter_pages(
+        self, source: PdfSource, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[str]:
+        reader = pypdf.PdfReader(_as_file(source))
+        try:
+            for page in reader.pages[start:stop]:
+                yield page.extract_text() or ""
+        finally:
+            # No per-page release in pypdf: drop everything it has parsed
+            reader.close()
+
+
+class PdfplumberBackend(PdfTextBackend):
+    """Full layout analysis. Slowest, but the most robust on odd layouts."""
+
+    name = "pdfplumber"
+
+    def page_count(self, source: PdfSource) -> int:
+        with pdfplumber.open(_as_file(source)) as pdf:
+            return len(pdf.pages)
+
+    def iter_pages(
+        self, source: PdfSource, start: int = 0, stop: Optional[int] = None
+    ) -> Iterator[str]:
+        with pdfplumber.open(_as_file(source)) as pdf:
+            for page in pdf.pages[start:stop]:
+                try:
+                    yield page.extract_text() or ""
+                finally:
+                    # Drops the page's cached layout objects and char lists
+                    page.close()
+
+    def count_chars(self, source: PdfSource, max_pages: int) -> int:
+        # Raw glyph count; skips pdfplumber's text layout step
+        with pdfplumber.open(_as_file(source)) as pdf:
+            total = 0
+            for page in pdf.pages[:max_pages]:
+                try:
+                    total += sum(
+                        1 for char in page.chars if not char["text"].isspace()
+                    )
+                finally:
+                    page.close()
+            return total
+
+
+BACKENDS: Dict[str, PdfTextBackend] = {
+    backend.name: backend
+    for backend in (PdfiumBackend(), PypdfBackend(), PdfplumberBackend())
+}
+FAST_BACKENDS = ("pdfium", "pypdf")
+FALLBACK_BACKEND = BACKENDS["pdfplumber"]
+
+
+def get_backend(name: Optional[str] = None) -> PdfTextBackend:
+    """Backend called ``name`` (default PDF_BACKEND), resolving "auto"."""
+    name = name or os.getenv("PDF_BACKEND", "auto")
+    if name == "auto":
+        for candidate in FAST_BACKENDS:
+            if BACKENDS[candidate].is_available():
+                return BACKENDS[candidate]
+        return FALLBACK_BACKEND
+    backend = BACKENDS.get(name)
+    if backend is None or not backend.is_available():
+        raise ValueError(f"PDF backend {name!r} is not available")
+    return backend
+
+
+def get_probe_backend() -> Optional[PdfTextBackend]:
+    """
+    Fastest installed backend for cheap structural questions (page count,
+    character count), whatever PDF_BACKEND says. None if only pdfplumber is.
+    """
+    for candidate in FAST_BACKENDS:
+        if BACKENDS[candidate].is_available():
+            return BACKENDS[candidate]
+    return None
+
+
+def _is_garbled(ch: str) -> bool:
+    if ch == "\ufffd":
+        return True
+    category = unicodedata.category(ch)
+    return category == "Co" or (category == "Cc" and not ch.isspace())
+
+
+def text_looks_usable(pages: List[str]) -> bool:
+    """
+    Cheap quality check on extracted text: enough characters per page and
+    few garbled ones. Failing it sends the document to the fallback backend.
+    """
+    text = "".join(pages)
+    visible = sum(1 for ch in text if not ch.isspace())
+    if visible < MIN_CHARS_PER_PAGE * max(1, len(pages)):
+        return False
+    garbled = sum(1 for ch in text if _is_garbled(ch)) + 5 * text.count("(cid:")
+    return garbled <= MAX_GARBLED_RATIO * visible
+
+
+def check_text_layer(
+    source: PdfSource,
+    backend: Optional[PdfTextBackend] = None,
+    max_pages: Optional[int] = None,
+) -> None:
+    """
+    Raise ``TextlessPdfError`` when the first pages carry (almost) no text.
+    Files the backend can't open are let through so extraction reports them.
+    """
+    backend = backend or get_probe_backend() or FALLBACK_BACKEND
+    max_pages = PDF_PRECHECK_PAGES if max_pages is None else max_pages
+    if max_pages <= 0:
+        return
+    try:
+        chars = backend.count_chars(source, max_pages)
+    except Exception:
+        return
+    if chars < MIN_CHARS_PER_PAGE:
+        raise TextlessPdfError(
+            "The PDF has no text layer (it looks scanned or image-only). "
+            "Please upload a text-based PDF or a TXT file."
+        )
+
+
+class PageStream:
+    """
+    Texts of pages ``start`` to ``stop`` in order, stopping after
+    ``max_pages`` pages or once ``time_budget`` seconds have been spent
+    (defaults: PDF_MAX_PAGES, PDF_TIME_BUDGET). The page that crosses the
+    budget is still yielded. ``timed_out`` tells, once iterated, whether
+    the time budget cut the pages short.
+    """
+
+    def __init__(
+        self,
+        source: PdfSource,
+        backend: Optional[PdfTextBackend] = None,
+        max_pages: Optional[int] = None,
+        time_budget: Optional[float] = None,
+        start: int = 0,
+        stop: Optional[int] = None,
+    ) -> None:
+        self.source = source
+        self.backend = backend or get_backend()
+        self.max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+        self.time_budget = PDF_TIME_BUDGET if time_budget is None else time_budget
+        self.start = start
+        self.stop = stop
+        self.timed_out = False
+
+    def __iter__(self) -> Iterator[str]:
+        backend, max_pages, time_budget = self.backend, self.max_pages, self.time_budget
+        deadline = time.monotonic() + time_budget if time_budget > 0 else None
+
+        pages = backend.iter_pages(self.source, self.start, self.stop)
+        try:
+            for count, text in enumerate(pages, start=1):
+                yield text
+                if max_pages > 0 and count >= max_pages:
+                    logger.info("PDF truncated at %d pages (%s)", count, backend.name)
+                    break
+                if deadline is not None and time.monotonic() >= deadline:
+                    logger.warning(
+                        "PDF time budget of %.1fs spent after %d pages (%s)",
+                        time_budget,
+                        count,
+                        backend.name,
+                    )
+                    self.timed_out = True
+                    break
+        finally:
+            # Closing the generator runs the backend's cleanup (document close)
+            pages.close()
+
+
+def extract_with_fallback(
+    source: PdfSource,
+    backend: Optional[PdfTextBackend] = None,
+    max_pages: Optional[int] = None,
+    time_budget: Optional[float] = None,
+    start: int = 0,
+    stop: Optional[int] = None,
+) -> Tuple[List[str], bool]:
+    """
+    Page texts from the primary backend, or from pdfplumber when the
+    primary fails or its output doesn't pass ``text_looks_usable``. The
+    fallback only gets whatever is left of the time budget.
+
+    Also returns whether the text is complete: ``False`` when the time
+    budget cut extraction short, which depends on load at the time, so
+    callers shouldn't cache such text. The PDF_MAX_PAGES cap doesn't count.
+    """
+    backend = backend or get_backend()
+    time_budget = PDF_TIME_BUDGET if time_budget is None else time_budget
+    started = time.monotonic()
+    stream = PageStream(source, backend, max_pages, time_budget, start, stop)
+    try:
+        pages = list(stream)
+    except Exception:
+        if backend is FALLBACK_BACKEND:
+            raise
+        pages = []
+    if backend is FALLBACK_BACKEND or text_looks_usable(pages):
+        return pages, not stream.timed_out
+
+    remaining = 0.0
+    if time_budget > 0:
+        remaining = time_budget - (time.monotonic() - started)
+        if remaining <= 0:
+            # No time left to fall back: unusable fast-path text, incomplete
+            return pages, False
+    stream = PageStream(source, FALLBACK_BACKEND, max_pages, remaining, start, stop)
+    return list(stream), not stream.timed_out
@@ -0,0 +1,180 @@
+"""
+PDF text extraction kept off the event loop.
+
+PDF parsing is CPU bound (see ``pdf_backends``), so a large PDF parsed inline
+blocks uvicorn's event loop and stalls every concurrent request. Extraction
+runs instead in a ``ProcessPoolExecutor`` whose workers live for the whole
+app lifetime (PDF libraries are imported once per worker, not per request).
+
+PDF_WORKERS sets the pool size; ``0`` extracts inline on the event loop,
+which is only meant for debugging and benchmarks.
+
+Documents of PDF_PARALLEL_MIN_PAGES pages or more (after the PDF_MAX_PAGES
+cap) are split into contiguous page ranges, one per worker; every worker
+opens the same bytes and the texts are stitched back together in page order.
+Shorter documents go to a single worker and never pay for the fan-out.
+
+Every entry point returns the text with a ``complete`` flag that is
+``False`` when PDF_TIME_BUDGET cut extraction short; such text depends on
+load at the time and must not be cached.
+"""
+
+import asyncio
+import multiprocessing
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Tuple
+
+from starlette.concurrency import run_in_threadpool
+
+from .pdf_backends import (
+    PDF_MAX_PAGES,
+    PdfSource,
+    PdfTextBackend,
+    check_text_layer,
+    extract_with_fallback,
+    get_backend,
+    get_probe_backend,
+)
+
+
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", str(min(4, os.cpu_count() or 1))))
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "16"))
+
+_pool: Optional[ProcessPoolExecutor] = None
+
+
+def extract_pdf_text(source: PdfSource, precheck: bool = True) -> Tuple[str, bool]:
+    """
+    Text of every page, joined with newlines, and whether it is complete.
+    Runs inside pool workers.
+    """
+    if precheck:
+        check_text_layer(source)
+    pages, complete = extract_with_fallback(source)
+    return "\n".join(pages), complete
+
+
+def extraction_stamp() -> str:
+    """Settings that change the extracted text, for keying text caches."""
+    return f"{get_backend().name}-p{PDF_MAX_PAGES}"
+
+
+def extract_pdf_pages(
+    source: PdfSource, start: int, stop: int
+) -> Tuple[List[str], bool]:
+    """
+    Texts of pages ``start`` to ``stop`` and whether they are complete.
+    Runs inside pool workers.
+    """
+    return extract_with_fallback(source, max_pages=0, start=start, stop=stop)
+
+
+def page_ranges(page_count: int, parts: int) -> List[Tuple[int, int]]:
+    """Split ``page_count`` pages into at most ``parts`` balanced ranges."""
+    parts = max(1, min(parts, page_count))
+    size, extra = divmod(page_count, parts)
+    ranges, start = [], 0
+    for i in range(parts):
+        stop = start + size + (1 if i < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def _ping() -> int:
+    return os.getpid()
+
+
+def get_pdf_pool() -> Optional[ProcessPoolExecutor]:
+    """The shared extraction pool, created on first use (None when disabled)."""
+    global _pool
+    if _pool is None and PDF_WORKERS > 0:
+        # "spawn" keeps workers lean: they import only the PDF backends,
+        # not spaCy / the app, and don't inherit server threads.
+        _pool = ProcessPoolExecutor(
+            max_workers=PDF_WORKERS, mp_context=multiprocessing.get_context("spawn")
+        )
+    return _pool
+
+
+def start_pdf_pool() -> None:
+    """
+    Create the pool and start its workers up front, so the first PDF upload
+    doesn't pay for process start-up.
+    """
+    pool = get_pdf_pool()
+    if pool is not None:
+        for future in [pool.submit(_ping) for _ in range(PDF_WORKERS)]:
+            future.result()
+
+
+def shutdown_pdf_pool() -> None:
+    global _pool
+    if _pool is not None:
+        _pool.shutdown(wait=False, cancel_futures=True)
+        _pool = None
+
+
+def _capped_page_count(source: PdfSource, probe: PdfTextBackend) -> int:
+    try:
+        page_count = probe.page_count(source)
+    except Exception:
+        # Unreadable: the single-worker path reports the real error
+        return 0
+    return min(page_count, PDF_MAX_PAGES) if PDF_MAX_PAGES > 0 else page_count
+
+
+async def extract_pdf_text_parallel(
+    source: PdfSource, pool: ProcessPoolExecutor, workers: int, page_count: int
+) -> Tuple[str, bool]:
+    """
+    Extract the first ``page_count`` pages split across ``workers`` pool
+    workers. A range cut short by the time budget drops every later range,
+    so the text never has holes in the middle.
+    """
+    loop = asyncio.get_running_loop()
+    ranges = page_ranges(page_count, workers)
+    chunks = await asyncio.gather(
+        *(
+            loop.run_in_executor(pool, extract_pdf_pages, source, start, stop)
+            for start, stop in ranges
+        )
+    )
+    pages: List[str] = []
+    for chunk, complete in chunks:
+        pages.extend(chunk)
+        if not complete:
+            return "\n".join(pages), False
+    return "\n".join(pages), True
+
+
+async def extract_pdf_text_async(source: PdfSource) -> Tuple[str, bool]:
+    """
+    Extract in the process pool and await the text, and whether it is
+    complete, without blocking the loop.
+    """
+    pool = get_pdf_pool()
+    if pool is None:
+        return extract_pdf_text(source)
+    loop = asyncio.get_running_loop()
+    probe = get_probe_backend()
+    if probe is None:
+        # Only pdfplumber is installed and even its pre-check needs a layout
+        # pass per page: keep everything in the pool
+        return await loop.run_in_executor(pool, extract_pdf_text, source)
+
+    # Both take a few milliseconds with a fast backend, so scanned files are
+    # rejected here without ever occupying a worker. They still open and
+    # parse the PDF, so they run in the threadpool, not on the event loop.
+    await run_in_threadpool(check_text_layer, source, probe)
+    page_count = await run_in_threadpool(_capped_page_count, source, probe)
+    if (
+        PDF_WORKERS > 1
+        and PDF_PARALLEL_MIN_PAGES > 0
+        and page_count >= PDF_PARALLEL_MIN_PAGES
+    ):
+        return await extract_pdf_text_parallel(
+            source, pool, PDF_WORKERS, page_count
+        )
+    return await loop.run_in_executor(pool, extract_pdf_text, source, False)
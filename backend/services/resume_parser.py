@@ -1,20 +1,72 @@
-import io
+import hashlib
+import os
 import re
-from typing import List
+from typing import List, Optional, Tuple
 
-import pdfplumber
 from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
 
 from ..models.schemas import CandidateProfile
-from ..utils.skills_db import NORMALISED_SKILLS, normalise_skill
+from ..utils.cache import DiskCache, LRUCache, TieredCache
+from ..utils.skill_matcher import SkillOccurrences
+from ..utils.skills_db import SkillVocabulary, get_vocabulary
+from .document import Document, as_document
+from .line_classifier import LineClassifier
+from .name_detector import NAME_CONFIDENCE_THRESHOLD, detect_name
+from .pdf_extraction import extract_pdf_text_async, extraction_stamp
 from .spacy_assistant import get_spacy_assistant
+from .uploads import receive_upload
 
 
-EMAIL_REGEX = re.compile(r"[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}")
+# The lookbehind only lets a match start where a run of local-part characters
+# starts; without it a long run is re-scanned from every position (quadratic)
+# for the same result
+EMAIL_REGEX = re.compile(
+    r"(?<![A-Za-z0-9._%+-])[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}"
+)
 PHONE_REGEX = re.compile(
     r"(\+?\d{1,3}[-.\s]?)?(\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4})"
 )
 
+LINE_CLASSIFIER = LineClassifier()
+
+# Extracted PDF text keyed by a hash of the uploaded bytes: the same resume
+# is typically sent to /parse-resume and then to /match against several JDs.
+TEXT_CACHE_MAX_CHARS = int(os.getenv("TEXT_CACHE_MAX_CHARS", str(64 * 2**20)))
+# Resume text is personal data: the disk tier is off unless TEXT_CACHE_DIR is
+# set, and its entries expire after TEXT_CACHE_MAX_AGE seconds
+TEXT_CACHE_DIR = os.getenv("TEXT_CACHE_DIR", "")
+TEXT_CACHE_MAX_AGE = int(os.getenv("TEXT_CACHE_MAX_AGE", str(7 * 24 * 3600)))
+TEXT_CACHE = TieredCache(
+    LRUCache(max_entries=0, max_size=TEXT_CACHE_MAX_CHARS, sizeof=len),
+    DiskCache(TEXT_CACHE_DIR, max_age=TEXT_CACHE_MAX_AGE) if TEXT_CACHE_DIR else None,
+    encode=str.encode,
+    decode=bytes.decode,
+)
+
+# Parsed profiles keyed by a hash of the normalised text plus a stamp of
+# everything that shapes the result. Bump PARSER_VERSION whenever a change to
+# the extractors alters their output so stale entries are never served.
+PARSER_VERSION = 2
+PROFILE_CACHE_SIZE = int(os.getenv("PROFILE_CACHE_SIZE", "2048"))
+PROFILE_CACHE = LRUCache(max_entries=PROFILE_CACHE_SIZE)
+
+
+def normalised_text_hash(text: str) -> str:
+    """SHA-256 of ``text`` with line endings unified and outer whitespace cut."""
+    normalised = text.replace("\r\n", "\n").replace("\r", "\n").strip()
+    return hashlib.sha256(normalised.encode("utf-8")).hexdigest()
+
+
+def profile_stamp(vocabulary: SkillVocabulary) -> str:
+    """
+    Parser version, vocabulary fingerprint, fuzzy threshold and whether spaCy
+    NER is in play: changing any of them invalidates cached profiles.
+    """
+    fuzzy = vocabulary.fuzzy_index.threshold if vocabulary.fuzzy_index else 0
+    ner = "ner" if get_spacy_assistant().is_available() else "rules"
+    return f"v{PARSER_VERSION}-{vocabulary.fingerprint[:16]}-f{fuzzy}-{ner}"
+
 
 class ResumeParser:
     """
@@ -28,42 +80,139 @@ class ResumeParser:
             raise ValueError("File must have a name")
 
         filename = file.filename.lower()
-        content = await file.read()
+        if not filename.endswith((".pdf", ".txt")):
+            raise ValueError("Unsupported file type. Please upload a PDF or TXT file.")
 
-        if filename.endswith(".pdf"):
-            return self._extract_pdf_text(content)
+        # Starlette has already spooled the upload; it is hashed in place
+        upload = await receive_upload(file)
         if filename.endswith(".txt"):
-            return content.decode("utf-8", errors="ignore")
-
-        raise ValueError("Unsupported file type. Please upload a PDF or TXT file.")
-
-    def _extract_pdf_text(self, raw_bytes: bytes) -> str:
-        with pdfplumber.open(io.BytesIO(raw_bytes)) as pdf:
-            pages_text = [page.extract_text() or "" for page in pdf.pages]
-        return "\n".join(pages_text)
-
-    def parse_profile(self, text: str) -> CandidateProfile:
-        email = self._extract_email(text)
-        phone = self._extract_phone(text)
-        
-        # Try spaCy NER first for name extraction, fallback to heuristic
-        spacy_assistant = get_spacy_assistant()
-        name = None
-        if spacy_assistant.is_available():
-            name = spacy_assistant.extract_name_with_ner(text)
+            data = await run_in_threadpool(upload.read_bytes)
+            return data.decode("utf-8", errors="ignore")
+
+        key = f"{upload.sha256}-{extraction_stamp()}"
+        text = TEXT_CACHE.get(key)
+        if text is None:
+            source = await run_in_threadpool(upload.source)
+            # Runs in the PDF worker pool so the event loop stays responsive
+            text, complete = await extract_pdf_text_async(source)
+            # Text cut short by the time budget depends on load at the
+            # time; the next upload of this file should try again
+            if complete:
+                TEXT_CACHE.put(key, text)
+        return text
+
+    def parse_profile(
+        self,
+        text: "str | Document",
+        vocabulary: Optional[SkillVocabulary] = None,
+    ) -> CandidateProfile:
+        """
+        Structured profile of a resume. Repeat parses of the same text with
+        the same vocabulary are served from ``PROFILE_CACHE``.
+        """
+        doc = as_document(text)
+        vocabulary = vocabulary or get_vocabulary()
+        key = f"{normalised_text_hash(doc.text)}-{profile_stamp(vocabulary)}"
+        profile = PROFILE_CACHE.get(key)
+        if profile is None:
+            profile = self._parse_document(doc, vocabulary)
+            PROFILE_CACHE.put(key, profile)
+        # Callers get their own copy so the cached entry can't be mutated
+        return profile.model_copy(deep=True)
+
+    def parse_profiles(
+        self,
+        texts: "List[str | Document]",
+        vocabulary: Optional[SkillVocabulary] = None,
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> List[CandidateProfile]:
+        """
+        ``parse_profile`` for bulk jobs, in input order. NER for the resumes
+        not yet in ``PROFILE_CACHE`` whose name the rule-based detector isn't
+        confident about runs as one batched spaCy pass
+        (``SpacyAssistant.extract_names``) instead of one call per resume.
+        """
+        docs = [as_document(text) for text in texts]
+        vocabulary = vocabulary or get_vocabulary()
+        stamp = profile_stamp(vocabulary)
+        keys = [f"{normalised_text_hash(doc.text)}-{stamp}" for doc in docs]
+        profiles = [PROFILE_CACHE.get(key) for key in keys]
+        missing = [i for i, profile in enumerate(profiles) if profile is None]
+
+        needs_ner = [
+            i for i in missing if self._fast_name(docs[i])[1] < NAME_CONFIDENCE_THRESHOLD
+        ]
+        names = get_spacy_assistant().extract_names(
+            [self._ner_text(docs[i]) for i in needs_ner], batch_size, n_process
+        )
+        ner_names = dict(zip(needs_ner, names))
+        for i in missing:
+            profiles[i] = self._parse_document(
+                docs[i], vocabulary, ner_name=ner_names.get(i), run_ner=False
+            )
+            PROFILE_CACHE.put(keys[i], profiles[i])
+        return [profile.model_copy(deep=True) for profile in profiles]
+
+    @staticmethod
+    def _ner_text(doc: Document) -> str:
+        # The name sits in the header; the whole text when there is none
+        return doc.header.text or doc.text
+
+    def _fast_name(self, doc: Document) -> Tuple[Optional[str], float]:
+        """Rule-based ``(name, confidence)``, see ``name_detector``."""
+        email = self._extract_email(doc.header.text)
+        if email is None and len(doc.sections.header) < len(doc.lines):
+            email = self._extract_email(doc.text)
+        return detect_name(doc.sections.header or doc.lines, email)
+
+    def _parse_document(
+        self,
+        doc: Document,
+        vocabulary: SkillVocabulary,
+        ner_name: Optional[str] = None,
+        run_ner: bool = True,
+    ) -> CandidateProfile:
+        """``ner_name`` is the NER result when the caller already ran it."""
+        # Lines, sections, lower-cased text and skill scans are computed lazily
+        # on the shared document and reused by every extractor below.
+        sections = doc.sections
+        # Contact details and the name live above the first heading; only fall
+        # back to the whole text when the header doesn't have them.
+        header = doc.header
+
+        email = self._extract_email(header.text)
+        phone = self._extract_phone(header.text)
+        # Without headings the header is the whole document: don't scan twice
+        if len(sections.header) < len(doc.lines):
+            email = email or self._extract_email(doc.text)
+            phone = phone or self._extract_phone(doc.text)
+
+        # Rule-based detector first; spaCy NER only when it isn't confident,
+        # then the loose heuristic as a last resort
+        name, confidence = detect_name(sections.header or doc.lines, email)
+        if confidence < NAME_CONFIDENCE_THRESHOLD:
+            ner = ner_name
+            spacy_assistant = get_spacy_assistant()
+            if run_ner and spacy_assistant.is_available():
+                # NER-only pipeline over a short window of the header
+                ner = spacy_assistant.extract_name_with_ner(self._ner_text(doc))
+            name = ner or name
         if not name:
-            name = self._guess_name(text, email)
-        
+            name = self._guess_name(sections.header or doc.lines, email)
+
         # Skill extraction
         # NOTE: We intentionally keep this STRICT and keyword‑based so that
         # we only return skills that are explicitly mentioned in the resume text.
         # spaCy‑based suggestions are avoided here because they can introduce
         # skills that are not actually present in the document.
-        skills = self._extract_skills(text)
-        
-        education = self._extract_education(text)
-        experience = self._extract_experience(text)
-        certifications = self._extract_certifications(text)
+        # Skills are mentioned throughout (experience bullets, projects), so
+        # this one scans the whole text rather than the skills section.
+        skills = self._extract_skills(doc, vocabulary)
+
+        # Education, experience and certifications come from one keyword pass
+        # over the lines; each only takes lines from its own section.
+        education, experience, certifications = LINE_CLASSIFIER.classify(sections)
 
         return CandidateProfile(
             name=name,
@@ -85,13 +234,12 @@ class ResumeParser:
             return None
         return match.group(0)
 
-    def _guess_name(self, text: str, email: str | None) -> str | None:
+    def _guess_name(self, lines: List[str], email: str | None) -> str | None:
         """
         Heuristic: take the first non-empty line that isn't obviously a heading
         and doesn't contain contact keywords. If we have an email, prefer a line
         that appears close to it.
         """
-        lines = [l.strip() for l in text.splitlines() if l.strip()]
         if not lines:
             return None
 
@@ -121,105 +269,29 @@ class ResumeParser:
 
         return None
 
-    def _extract_skills(self, text: str) -> List[str]:
-        text_lower = text.lower()
-        detected = set()
-        for vocab_skill in NORMALISED_SKILLS:
-            # Use word boundaries to avoid partial matches
-            if re.search(r'\b' + re.escape(vocab_skill) + r'\b', text_lower):
-                detected.add(vocab_skill)
-        # Return nicely cased skills
-        return sorted({skill.title() for skill in detected})
-
-    def _extract_education(self, text: str) -> List[str]:
-        education_keywords = [
-            "b.tech",
-            "b.e",
-            "bachelor",
-            "master",
-            "msc",
-            "bsc",
-            "mba",
-            "phd",
-            "university",
-            "college",
-            "institute",
-            "bachelors",
-            "masters",
-        ]
-        lines = [l.strip() for l in text.splitlines() if l.strip()]
-        edu_lines: List[str] = []
-        for line in lines:
-            lower = line.lower()
-            if any(k in lower for k in education_keywords):
-                edu_lines.append(line)
-        return edu_lines
-
-    def _extract_experience(self, text: str) -> List[str]:
+    def extract_skill_bits(
+        self,
+        text: "str | Document",
+        vocabulary: Optional[SkillVocabulary] = None,
+    ) -> int:
+        """Detected skills as a skill-id bitset (see ``SkillVocabulary.skills_to_bits``)."""
+        return self.extract_skill_occurrences(text, vocabulary).bits()
+
+    def extract_skill_occurrences(
+        self,
+        text: "str | Document",
+        vocabulary: Optional[SkillVocabulary] = None,
+    ) -> SkillOccurrences:
         """
-        Extract only concrete work / internship experience entries.
-
-        We try to avoid:
-        - Generic summary sentences about being a student
-        - Education lines that mention degrees/CGPA
-        - Section headers like "Experience"
+        Every skill mention with character offsets into the text, from one
+        pass that is cached on the document. Use ``.counts()`` for
+        frequencies and ``.bits()`` for the skill set.
         """
-        job_keywords = [
-            "intern",
-            "internship",
-            "developer",
-            "engineer",
-            "manager",
-            "lead",
-            "architect",
-            "analyst",
-        ]
-        helper_keywords = [
-            "duration",  # e.g. "Duration: Nov 2025 – Dec 2025"
-            "worked as",
-            "work experience",
-        ]
-        # Things we explicitly do NOT want in experience items
-        exclude_keywords = [
-            "b.tech",
-            "bachelor",
-            "b.e",
-            "cgpa",
-            "student",
-            "education",
-            "university",
-            "college",
-            "institute",
-        ]
-
-        lines = [l.strip() for l in text.splitlines() if l.strip()]
-        exp_lines: List[str] = []
-        for line in lines:
-            lower = line.lower()
-
-            # Skip obvious section headers
-            if lower in {"experience", "work experience", "professional experience"}:
-                continue
-
-            # Skip lines that clearly belong to education or summary
-            if any(bad in lower for bad in exclude_keywords):
-                continue
-
-            # Keep lines that mention job / role keywords or duration markers
-            if any(k in lower for k in job_keywords) or any(
-                k in lower for k in helper_keywords
-            ):
-                exp_lines.append(line)
-
-        return exp_lines
-
-    def _extract_certifications(self, text: str) -> List[str]:
-        lines = [l.strip() for l in text.splitlines() if l.strip()]
-        cert_lines: List[str] = []
-        for line in lines:
-            lower = line.lower()
-            if "certification" in lower or "certified" in lower:
-                cert_lines.append(line)
-        return cert_lines
-
+        # Single pass over the text; only whole-word matches are reported
+        return as_document(text).skill_occurrences(vocabulary or get_vocabulary())
 
+    def _extract_skills(self, doc: Document, vocabulary: SkillVocabulary) -> List[str]:
+        occurrences = self.extract_skill_occurrences(doc, vocabulary)
+        detected = vocabulary.bits_to_skills(occurrences.bits())
+        # Return nicely cased skills
+        return sorted({skill.title() for skill in detected})
@@ -0,0 +1,129 @@
+"""
+One-pass resume section segmenter.
+
+Splits a resume into blocks by detecting heading lines ("Experience",
+"TECHNICAL SKILLS:", "Education & Training", ...). Everything above the
+first heading is the header, where the name and contact details live.
+"""
+
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Set
+
+
+SECTION_HEADINGS: Dict[str, List[str]] = {
+    "skills": [
+        "skills",
+        "technical skills",
+        "key skills",
+        "core skills",
+        "skills and tools",
+        "skill set",
+        "technologies",
+        "tech stack",
+        "tools and technologies",
+        "competencies",
+        "core competencies",
+    ],
+    "experience": [
+        "experience",
+        "work experience",
+        "professional experience",
+        "relevant experience",
+        "employment",
+        "employment history",
+        "work history",
+        "career history",
+        "internships",
+        "internship experience",
+    ],
+    "education": [
+        "education",
+        "education and training",
+        "academic background",
+        "academics",
+        "academic qualifications",
+        "educational qualifications",
+        "qualifications",
+    ],
+    "certifications": [
+        "certifications",
+        "certification",
+        "certificates",
+        "licenses and certifications",
+        "certifications and courses",
+        "courses",
+    ],
+    # Recognised so they close the previous section, but not used by any extractor
+    "other": [
+        "summary",
+        "professional summary",
+        "profile",
+        "objective",
+        "career objective",
+        "about me",
+        "projects",
+        "personal projects",
+        "academic projects",
+        "achievements",
+        "awards",
+        "publications",
+        "languages",
+        "interests",
+        "hobbies",
+        "references",
+        "volunteering",
+    ],
+}
+
+HEADING_LOOKUP = {
+    heading: section
+    for section, headings in SECTION_HEADINGS.items()
+    for heading in headings
+}
+
+# Headings are short; anything longer is a content line that happens to
+# start with a section word ("Experience building REST APIs ...").
+_MAX_HEADING_CHARS = 40
+_DECORATION = re.compile(r"^[\W_]+|[\W_]+$")
+
+
+def heading_section(line: str) -> str | None:
+    """Section name if ``line`` (already stripped) looks like a heading."""
+    if len(line) > _MAX_HEADING_CHARS:
+        return None
+    key = _DECORATION.sub("", line.lower()).replace("&", "and")
+    return HEADING_LOOKUP.get(" ".join(key.split()))
+
+
+@dataclass
+class ResumeSections:
+    """Stripped, non-empty lines of each block; headings themselves are dropped."""
+
+    lines: List[str]
+    header: List[str] = field(default_factory=list)
+    skills: List[str] = field(default_factory=list)
+    experience: List[str] = field(default_factory=list)
+    education: List[str] = field(default_factory=list)
+    certifications: List[str] = field(default_factory=list)
+    other: List[str] = field(default_factory=list)
+    # Sections that had an explicit heading
+    found: Set[str] = field(default_factory=set)
+    # Section of every entry in ``lines`` ("heading" for the headings)
+    labels: List[str] = field(default_factory=list)
+
+
+def segment_resume(lines: List[str]) -> ResumeSections:
+    """Assign every stripped, non-empty line to a section in one pass."""
+    sections = ResumeSections(lines=lines)
+    current, label = sections.header, "header"
+    for line in lines:
+        section = heading_section(line)
+        if section is not None:
+            sections.found.add(section)
+            current, label = getattr(sections, section), section
+            sections.labels.append("heading")
+            continue
+        current.append(line)
+        sections.labels.append(label)
+    return sections
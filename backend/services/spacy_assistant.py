@@ -7,40 +7,157 @@ Uses spaCy for:
 - Dependency parsing for structured data extraction
 """
 
+import hashlib
+import os
+import threading
+from itertools import islice
+from typing import List, Optional, Dict
+
 try:
     import spacy
     from spacy import displacy
+    from spacy.matcher import PhraseMatcher
+    from spacy.tokens import Doc
     SPACY_AVAILABLE = True
 except ImportError:
     SPACY_AVAILABLE = False
 
-from typing import List, Optional, Dict
+from ..utils.cache import LRUCache
+from ..utils.skills_db import get_vocabulary
+
+
+SPACY_MODEL = os.getenv("SPACY_MODEL", "en_core_web_sm")
+
+# Components the NER-only variant never needs. tok2vec is kept loaded but
+# disabled unless NER listens to it (en_core_web_sm's NER has its own).
+NER_EXCLUDED_COMPONENTS = [
+    "tagger",
+    "parser",
+    "senter",
+    "attribute_ruler",
+    "lemmatizer",
+]
+
+# Name extraction parses this many leading characters first and retries on
+# the larger window only when the first finds no plausible PERSON.
+NAME_WINDOWS = (1_000, 5_000)
+
+# Longest prefix of a document the full pipeline parses
+SPACY_TEXT_LIMIT = 100_000
+# Full-pipeline Docs kept by text hash, so every helper asked about the same
+# text within a request reuses one parse. Docs are large: keep this small.
+DOC_CACHE_SIZE = int(os.getenv("SPACY_DOC_CACHE_SIZE", "32"))
+
+# Defaults of the batch APIs (``parse_many`` / ``extract_names``)
+SPACY_BATCH_SIZE = int(os.getenv("SPACY_BATCH_SIZE", "32"))
+SPACY_N_PROCESS = int(os.getenv("SPACY_N_PROCESS", "1"))
 
 
 class SpacyAssistant:
     """
     spaCy-powered NLP assistant for resume and job description analysis.
     Falls back gracefully if spaCy is not installed.
+
+    Two variants of the model are used: ``ner_nlp``, loaded up front with
+    only the NER component, serves name extraction on every resume; the full
+    pipeline (``nlp``) is loaded on first use by the POS / parser based
+    helpers, so a deployment that only parses resumes never holds it.
+
+    Every full-pipeline helper accepts either text or a Doc from ``parse``;
+    ``parse`` caches Docs by text hash, so however many insights are asked
+    for, each document goes through the full pipeline once.
     """
 
     def __init__(self):
-        self.nlp = None
+        self.ner_nlp = None
+        self._nlp = None
+        self._nlp_lock = threading.Lock()
+        self._docs = LRUCache(max_entries=DOC_CACHE_SIZE)
+        # Compiled skill PhraseMatchers by keyword list / vocabulary version
+        self._skill_matchers = LRUCache(max_entries=4)
         if SPACY_AVAILABLE:
             try:
-                # Try to load English model, fallback to small if not available
-                try:
-                    self.nlp = spacy.load("en_core_web_sm")
-                except OSError:
-                    # Model not installed, will use basic tokenization
-                    self.nlp = None
+                self.ner_nlp = self._load_ner_pipeline()
             except Exception:
-                self.nlp = None
+                # Model not installed, will use basic tokenization
+                self.ner_nlp = None
+
+    @staticmethod
+    def _load_ner_pipeline():
+        nlp = spacy.load(SPACY_MODEL, exclude=NER_EXCLUDED_COMPONENTS)
+        if "tok2vec" in nlp.pipe_names:
+            tok2vec = nlp.get_pipe("tok2vec")
+            if "ner" not in getattr(tok2vec, "listening_components", []):
+                nlp.disable_pipe("tok2vec")
+        return nlp
+
+    @property
+    def nlp(self):
+        """Full pipeline (tagger, parser, lemmatizer, NER), loaded on first use."""
+        if self._nlp is None and self.ner_nlp is not None:
+            with self._nlp_lock:
+                if self._nlp is None:
+                    self._nlp = spacy.load(SPACY_MODEL)
+        return self._nlp
 
     def is_available(self) -> bool:
         """Check if spaCy is available and loaded."""
-        return self.nlp is not None
+        return self.ner_nlp is not None
 
-    def extract_entities(self, text: str) -> Dict[str, List[str]]:
+    def parse(self, text: "str | Doc") -> Optional["Doc"]:
+        """
+        Full-pipeline Doc of the first ``SPACY_TEXT_LIMIT`` characters of
+        ``text``, reused from the Doc cache when the same text was parsed
+        recently. A Doc passed in is returned as is; None without spaCy.
+        """
+        if not self.is_available():
+            return None
+        if isinstance(text, Doc):
+            return text
+        text = text[:SPACY_TEXT_LIMIT]
+        key = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        doc = self._docs.get(key)
+        if doc is None:
+            doc = self.nlp(text)
+            self._docs.put(key, doc)
+        return doc
+
+    def parse_many(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> List[Optional["Doc"]]:
+        """
+        ``parse`` for many texts at once: cache misses go through
+        ``nlp.pipe`` in batches of ``batch_size`` across ``n_process``
+        processes (defaults SPACY_BATCH_SIZE, SPACY_N_PROCESS). Docs come
+        back in input order; all None without spaCy.
+        """
+        if not self.is_available():
+            return [None] * len(texts)
+
+        texts = [text[:SPACY_TEXT_LIMIT] for text in texts]
+        keys = [hashlib.sha256(text.encode("utf-8")).hexdigest() for text in texts]
+        docs = [self._docs.get(key) for key in keys]
+
+        # Uncached texts, each parsed once even if it repeats in the batch
+        pending: Dict[str, str] = {}
+        for key, text, doc in zip(keys, texts, docs):
+            if doc is None:
+                pending.setdefault(key, text)
+        piped = self.nlp.pipe(
+            pending.values(),
+            batch_size=batch_size or SPACY_BATCH_SIZE,
+            n_process=n_process or SPACY_N_PROCESS,
+        )
+        # nlp.pipe yields in input order, also with several processes
+        parsed = dict(zip(pending, piped))
+        for key, doc in parsed.items():
+            self._docs.put(key, doc)
+        return [doc if doc is not None else parsed[key] for key, doc in zip(keys, docs)]
+
+    def extract_entities(self, text: "str | Doc") -> Dict[str, List[str]]:
         """
         Extract named entities using spaCy NER.
         Returns a dict with entity types as keys and lists of entities as values.
@@ -48,7 +165,7 @@ class SpacyAssistant:
         if not self.is_available():
             return {}
 
-        doc = self.nlp(text[:1000000])  # Limit to 1M chars for performance
+        doc = self.parse(text)
         entities = {
             "PERSON": [],
             "ORG": [],
@@ -67,19 +184,63 @@ class SpacyAssistant:
 
         return entities
 
-    def extract_name_with_ner(self, text: str) -> Optional[str]:
+    def extract_name_with_ner(self, text: str, doc=None) -> Optional[str]:
         """
         Extract candidate name using spaCy NER (PERSON entities).
         Returns the most likely candidate name, preferring entities that:
         - Appear near the TOP of the document
         - Look like real person names (no digits, not generic words or titles)
+
+        Only the NER component runs, over the first ``NAME_WINDOWS[0]``
+        characters, then over the next larger window if nothing was found.
+        Pass ``doc`` if the caller already has a Doc with entities for ``text``.
         """
         if not self.is_available():
             return None
 
-        # Work directly with the doc so we can use entity positions
-        doc = self.nlp(text[:50000])
-
+        if doc is not None:
+            return self._best_person(doc)
+
+        for window in NAME_WINDOWS:
+            name = self._best_person(self.ner_nlp(text[:window]))
+            if name or window >= len(text):
+                return name
+        return None
+
+    def extract_names(
+        self,
+        texts: List[str],
+        batch_size: Optional[int] = None,
+        n_process: Optional[int] = None,
+    ) -> List[Optional[str]]:
+        """
+        ``extract_name_with_ner`` for many texts, in input order. Each
+        window size is one batched ``nlp.pipe`` run over the texts still
+        without a name.
+        """
+        if not self.is_available():
+            return [None] * len(texts)
+
+        names: List[Optional[str]] = [None] * len(texts)
+        pending = list(range(len(texts)))
+        for window in NAME_WINDOWS:
+            docs = self.ner_nlp.pipe(
+                (texts[i][:window] for i in pending),
+                batch_size=batch_size or SPACY_BATCH_SIZE,
+                n_process=n_process or SPACY_N_PROCESS,
+            )
+            retry = []
+            for i, doc in zip(pending, docs):
+                names[i] = self._best_person(doc)
+                if names[i] is None and window < len(texts[i]):
+                    retry.append(i)
+            pending = retry
+            if not pending:
+                break
+        return names
+
+    @staticmethod
+    def _best_person(doc) -> Optional[str]:
         # Common non‑name phrases that sometimes get tagged as PERSON
         banned_phrases = {
             "resume",
@@ -123,36 +284,69 @@ class SpacyAssistant:
         candidates.sort()
         return candidates[0][2]
 
-    def extract_skills_with_pos(self, text: str, skill_keywords: List[str]) -> List[str]:
+    def extract_skills_with_pos(
+        self, text: "str | Doc", skill_keywords: Optional[List[str]] = None
+    ) -> List[str]:
         """
         Extract skills using POS tagging to identify noun phrases and technical terms.
         Combines with keyword matching for better accuracy.
+
+        Keywords are found in one pass by a ``PhraseMatcher`` on lower-cased
+        tokens (see ``skill_phrase_matcher``); a match counts when it lies in
+        a noun chunk or covers a non-stop-word noun / proper noun. Without
+        ``skill_keywords`` the shared skill vocabulary is used and canonical
+        skill names are returned.
         """
         if not self.is_available():
             return []
 
-        doc = self.nlp(text[:50000])  # Limit for performance
-        detected_skills = set()
+        doc = self.parse(text)
+        matcher = self.skill_phrase_matcher(skill_keywords)
 
-        # Extract noun phrases that might be skills
+        in_chunk = bytearray(len(doc))
         for chunk in doc.noun_chunks:
-            chunk_text = chunk.text.lower().strip()
-            # Check if noun phrase matches any skill keyword
-            for skill in skill_keywords:
-                if skill.lower() in chunk_text or chunk_text in skill.lower():
-                    detected_skills.add(skill)
-
-        # Also check individual tokens that are proper nouns or nouns
-        for token in doc:
-            if token.pos_ in ["NOUN", "PROPN"] and not token.is_stop:
-                token_text = token.text.lower().strip()
-                for skill in skill_keywords:
-                    if skill.lower() == token_text or skill.lower() in token_text:
-                        detected_skills.add(skill)
-
-        return sorted(list(detected_skills))
-
-    def extract_organizations(self, text: str) -> List[str]:
+            in_chunk[chunk.start : chunk.end] = b"\x01" * len(chunk)
+
+        strings = self.nlp.vocab.strings
+        detected_skills = set()
+        for match_id, start, end in matcher(doc):
+            if any(in_chunk[start:end]) or any(
+                token.pos_ in ("NOUN", "PROPN") and not token.is_stop
+                for token in doc[start:end]
+            ):
+                detected_skills.add(strings[match_id])
+
+        return sorted(detected_skills)
+
+    def skill_phrase_matcher(self, skill_keywords: Optional[List[str]] = None):
+        """
+        ``PhraseMatcher`` (attr="LOWER") for ``skill_keywords``, or for every
+        surface form of the current skill vocabulary labelled with its
+        canonical skill. Compiled once per keyword list / vocabulary version.
+        """
+        if skill_keywords is None:
+            vocabulary = get_vocabulary()
+            key = f"vocabulary:{vocabulary.fingerprint}"
+            patterns = {
+                surface: vocabulary.skills_by_id[skill_id]
+                for surface, skill_id in vocabulary.lookup.items()
+            }
+        else:
+            joined = "\n".join(skill_keywords).encode("utf-8")
+            key = f"keywords:{hashlib.sha256(joined).hexdigest()}"
+            patterns = {skill: skill for skill in skill_keywords}
+
+        matcher = self._skill_matchers.get(key)
+        if matcher is None:
+            matcher = PhraseMatcher(self.nlp.vocab, attr="LOWER")
+            # Tokenizer only: LOWER patterns need no other pipeline component
+            surfaces = list(patterns)
+            for surface, pattern in zip(surfaces, self.nlp.tokenizer.pipe(surfaces)):
+                matcher.add(patterns[surface], [pattern])
+            self._skill_matchers.put(key, matcher)
+        return matcher
+
+    def extract_organizations(self, text: "str | Doc") -> List[str]:
         """Extract organization names using NER."""
         if not self.is_available():
             return []
@@ -160,7 +354,7 @@ class SpacyAssistant:
         entities = self.extract_entities(text)
         return entities.get("ORG", [])
 
-    def analyze_job_description(self, jd_text: str) -> Dict:
+    def analyze_job_description(self, jd_text: "str | Doc") -> Dict:
         """
         Comprehensive analysis of job description using spaCy.
         Returns structured insights about requirements, skills, and entities.
@@ -172,18 +366,19 @@ class SpacyAssistant:
                 "requirements": [],
             }
 
-        doc = self.nlp(jd_text[:100000])
-        entities = self.extract_entities(jd_text)
+        # Parsed once; the entity extraction below reuses the same Doc
+        doc = self.parse(jd_text)
+        entities = self.extract_entities(doc)
 
         # Extract key phrases (noun phrases that might indicate requirements)
         key_phrases = []
-        for chunk in doc.noun_chunks[:50]:  # Limit to top 50
+        for chunk in islice(doc.noun_chunks, 50):  # Limit to top 50
             if len(chunk.text.split()) >= 2:  # Multi-word phrases
                 key_phrases.append(chunk.text.strip())
 
         # Extract requirement-like sentences
         requirements = []
-        for sent in doc.sents[:20]:  # Limit to first 20 sentences
+        for sent in islice(doc.sents, 20):  # Limit to first 20 sentences
             sent_text = sent.text.strip()
             # Look for sentences with requirement indicators
             if any(
@@ -198,7 +393,7 @@ class SpacyAssistant:
             "requirements": requirements[:5],
         }
 
-    def get_insights(self, resume_text: str, jd_text: str) -> Dict:
+    def get_insights(self, resume_text: "str | Doc", jd_text: "str | Doc") -> Dict:
         """
         Generate AI insights comparing resume and job description.
         Uses spaCy for semantic understanding.
@@ -209,8 +404,8 @@ class SpacyAssistant:
                 "recommendations": [],
             }
 
-        resume_doc = self.nlp(resume_text[:50000])
-        jd_doc = self.nlp(jd_text[:50000])
+        resume_doc = self.parse(resume_text)
+        jd_doc = self.parse(jd_text)
 
         # Extract key terms from both
         resume_nouns = [
@@ -244,19 +439,15 @@ class SpacyAssistant:
 
 # Global instance
 _assistant = None
+# Start-up warm-up and early requests may race to load the model
+_assistant_lock = threading.Lock()
 
 
 def get_spacy_assistant() -> SpacyAssistant:
     """Get or create the global spaCy assistant instance."""
     global _assistant
     if _assistant is None:
-        _assistant = SpacyAssistant()
+        with _assistant_lock:
+            if _assistant is None:
+                _assistant = SpacyAssistant()
     return _assistant
-
-
-
-
-
-
-
-
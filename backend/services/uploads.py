@@ -0,0 +1,139 @@
+"""
+Size limits and hashing for uploaded files.
+
+FastAPI parses the multipart body before a handler runs: Starlette streams
+each file part into a ``SpooledTemporaryFile`` (in memory up to 1 MiB, then
+an anonymous temp file) that ``UploadFile.file`` exposes. ``receive_upload``
+works on that file in place instead of copying it: it is hashed (the text
+cache key) and size-checked chunk by chunk in the threadpool.
+
+The hard limit is enforced earlier, while the body arrives, by
+``UploadSizeLimitMiddleware``: requests whose Content-Length is too large
+get 413 before anything is read, and the body of every other request,
+chunked ones included, is counted as it is received, so an oversized
+upload is cut off at the limit rather than spooled in full.
+"""
+
+import hashlib
+import os
+from typing import BinaryIO, Tuple
+
+from fastapi import UploadFile
+from starlette.concurrency import run_in_threadpool
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse
+
+
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(10 * 2**20)))
+UPLOAD_CHUNK_BYTES = 64 * 1024
+# Room for the multipart framing and the other form fields (the JD text)
+FORM_OVERHEAD_BYTES = 2**20
+
+
+class UploadTooLargeError(ValueError):
+    code = "upload_too_large"
+
+
+def _too_large_message(max_bytes: int) -> str:
+    return f"File is too large. The limit is {max_bytes / 2**20:.3g} MiB."
+
+
+def _too_large_detail(max_bytes: int) -> dict:
+    return {"code": UploadTooLargeError.code, "message": _too_large_message(max_bytes)}
+
+
+class ReceivedUpload:
+    """An ``UploadFile`` whose size and SHA-256 are known."""
+
+    def __init__(self, file: UploadFile, size: int, sha256: str) -> None:
+        self.file = file
+        self.size = size
+        self.sha256 = sha256
+
+    def read_bytes(self) -> bytes:
+        self.file.file.seek(0)
+        return self.file.file.read()
+
+    def source(self) -> "bytes | str":
+        """
+        The spool file's path when it has one, otherwise its bytes.
+        Starlette's rolled-over spool files are anonymous, so pool workers
+        can't open them by path and get a copy of at most UPLOAD_MAX_BYTES.
+        Blocking: call it from the threadpool.
+        """
+        name = getattr(self.file.file, "name", None)
+        if isinstance(name, str) and os.path.isfile(name):
+            return name
+        return self.read_bytes()
+
+
+def _hash_file(f: BinaryIO, max_bytes: int) -> Tuple[int, str]:
+    f.seek(0)
+    digest = hashlib.sha256()
+    size = 0
+    while chunk := f.read(UPLOAD_CHUNK_BYTES):
+        size += len(chunk)
+        if max_bytes and size > max_bytes:
+            raise UploadTooLargeError(_too_large_message(max_bytes))
+        digest.update(chunk)
+    f.seek(0)
+    return size, digest.hexdigest()
+
+
+async def receive_upload(
+    file: UploadFile, max_bytes: int = UPLOAD_MAX_BYTES
+) -> ReceivedUpload:
+    """
+    Hash ``file`` in place. Raises ``UploadTooLargeError`` when it holds
+    more than ``max_bytes``: the middleware's limit also counts the form
+    overhead, so a file can pass it and still be over this one.
+    """
+    if max_bytes and file.size is not None and file.size > max_bytes:
+        raise UploadTooLargeError(_too_large_message(max_bytes))
+    size, sha256 = await run_in_threadpool(_hash_file, file.file, max_bytes)
+    return ReceivedUpload(file, size, sha256)
+
+
+class UploadSizeLimitMiddleware:
+    """
+    Pure ASGI middleware answering 413 to requests whose body exceeds the
+    upload limit plus form overhead: from Content-Length before the body is
+    read, otherwise as soon as the bytes received pass the limit.
+    """
+
+    def __init__(self, app, max_bytes: int = UPLOAD_MAX_BYTES) -> None:
+        self.app = app
+        self.max_bytes = max_bytes
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] != "http" or not self.max_bytes:
+            await self.app(scope, receive, send)
+            return
+
+        limit = self.max_bytes + FORM_OVERHEAD_BYTES
+        content_length = dict(scope["headers"]).get(b"content-length")
+        if (
+            content_length is not None
+            and content_length.isdigit()
+            and int(content_length) > limit
+        ):
+            response = JSONResponse(
+                status_code=413, content={"detail": _too_large_detail(self.max_bytes)}
+            )
+            await response(scope, receive, send)
+            return
+
+        received = 0
+
+        async def limited_receive():
+            nonlocal received
+            message = await receive()
+            if message["type"] == "http.request":
+                received += len(message.get("body", b""))
+                if received > limit:
+                    # Raised inside FastAPI's body parsing, which re-raises
+                    # HTTPException, so the client gets this 413
+                    raise HTTPException(413, detail=_too_large_detail(self.max_bytes))
+            return message
+
+        await self.app(scope, limited_receive, send)
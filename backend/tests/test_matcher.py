@@ -0,0 +1,48 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from backend.services.matcher import MatchEngine
+from backend.utils.skills_db import get_vocabulary
+
+
+RESUMES = [
+    "Python developer with FastAPI, Docker and PostgreSQL experience.",
+    "Frontend engineer building React and TypeScript apps with Tailwind.",
+    "Data scientist training PyTorch models on Spark and Kafka pipelines.",
+    "Backend engineer writing Java and Spring Boot services on Kubernetes.",
+]
+JDS = [
+    "Hiring a backend engineer with Python and FastAPI skills.",
+    "Looking for a React developer comfortable with TypeScript and testing.",
+    "Machine learning role: PyTorch, pandas, NumPy and cloud deployment.",
+]
+
+
+def _compute(engine, i):
+    resume, jd = RESUMES[i % len(RESUMES)], JDS[i % len(JDS)]
+    return engine.compute_match(resume, jd, ["python"], ["python", "fastapi"])
+
+
+def test_compute_match_is_thread_safe():
+    engine = MatchEngine()
+    expected = [_compute(engine, i) for i in range(12)]
+    with ThreadPoolExecutor(max_workers=16) as pool:
+        results = list(pool.map(lambda i: _compute(engine, i), range(200)))
+    for i, result in enumerate(results):
+        assert result == expected[i % 12]
+
+
+def test_bitsets_and_skill_names_score_the_same():
+    vocabulary = get_vocabulary()
+    engine = MatchEngine()
+    candidate, jd = ["Python", "Docker", "React"], ["Python", "FastAPI", "Docker"]
+    by_name = engine.compute_match(RESUMES[0], JDS[0], candidate, jd, vocabulary)
+    by_bits = engine.compute_match(
+        RESUMES[0],
+        JDS[0],
+        vocabulary=vocabulary,
+        candidate_bits=vocabulary.skills_to_bits(candidate),
+        jd_bits=vocabulary.skills_to_bits(jd),
+    )
+    assert by_bits == by_name
+    assert by_bits.matched_skills == ["Docker", "Python"]
+    assert by_bits.missing_skills == ["Fastapi"]
@@ -0,0 +1,79 @@
+from typing import List, Optional
+
+import pytest
+
+from backend.services import resume_parser
+from backend.services.resume_parser import PROFILE_CACHE, ResumeParser
+
+
+KNOWN = "Jane Doe\njane.doe@example.com | +1 555 010 1234\n\nSkills\nPython, Docker"
+UNKNOWN = "Zorawar Quennell\nzq@example.com\n\nExperience\nBackend engineer, Python"
+NO_HEADINGS = "Priya Sharma\npriya@example.com\n+1 555 010 9876\nBuilt React apps"
+
+
+class FakeNer:
+    """Stands in for the spaCy assistant and records which texts reach NER."""
+
+    def __init__(self) -> None:
+        self.calls: List[str] = []
+
+    def is_available(self) -> bool:
+        return True
+
+    def extract_name_with_ner(self, text: str, doc=None) -> Optional[str]:
+        self.calls.append(text)
+        return f"NER {text.splitlines()[0]}"
+
+    def extract_names(self, texts, batch_size=None, n_process=None):
+        return [self.extract_name_with_ner(text) for text in texts]
+
+
+@pytest.fixture
+def ner(monkeypatch):
+    fake = FakeNer()
+    monkeypatch.setattr(resume_parser, "get_spacy_assistant", lambda: fake)
+    PROFILE_CACHE.clear()
+    yield fake
+    PROFILE_CACHE.clear()
+
+
+def test_confident_name_skips_ner(ner):
+    profile = ResumeParser().parse_profile(KNOWN)
+    assert profile.name == "Jane Doe"
+    assert ner.calls == []
+
+
+def test_unknown_name_falls_back_to_ner_on_the_header(ner):
+    profile = ResumeParser().parse_profile(UNKNOWN)
+    assert profile.name == "NER Zorawar Quennell"
+    assert ner.calls == ["Zorawar Quennell\nzq@example.com"]
+
+
+def test_batch_and_single_parses_agree(ner):
+    texts = [KNOWN, UNKNOWN, NO_HEADINGS, KNOWN.replace("Jane", "JANE")]
+    parser = ResumeParser()
+    batch = parser.parse_profiles(texts)
+    PROFILE_CACHE.clear()
+    assert batch == [parser.parse_profile(text) for text in texts]
+
+
+def test_contacts_without_headings_are_scanned_once(ner, monkeypatch):
+    parser = ResumeParser()
+    scanned = []
+    extract_email = parser._extract_email
+    monkeypatch.setattr(
+        parser, "_extract_email", lambda text: scanned.append(text) or extract_email(text)
+    )
+    profile = parser.parse_profile(NO_HEADINGS)
+    assert (profile.email, profile.phone) == ("priya@example.com", "+1 555 010 9876")
+    # The header is the whole text, so a miss must not rescan it
+    no_email = NO_HEADINGS.replace("priya@example.com\n", "")
+    profile = parser.parse_profile(no_email)
+    assert (profile.email, profile.phone) == (None, "+1 555 010 9876")
+    assert scanned == [NO_HEADINGS, no_email]
+
+
+def test_contacts_below_the_header_fall_back_to_the_whole_text(ner):
+    text = "Jane Doe\n\nSkills\nPython\n\nContact\njane.doe@example.com | +1 555 010 1234"
+    profile = ResumeParser().parse_profile(text)
+    assert (profile.email, profile.phone) == ("jane.doe@example.com", "+1 555 010 1234")
@@ -0,0 +1,39 @@
+import os
+import pickle
+
+from backend.utils.skills_db import CORE_SKILLS, SKILL_ALIASES, SkillVocabulary
+
+
+def _vocabulary(cache_dir) -> SkillVocabulary:
+    return SkillVocabulary(CORE_SKILLS, SKILL_ALIASES, cache_dir=str(cache_dir))
+
+
+def _plant(cache_dir, fingerprint: str) -> None:
+    with open(os.path.join(cache_dir, f"{fingerprint}.pickle"), "wb") as f:
+        pickle.dump("planted", f)
+
+
+def test_matcher_cache_round_trips_in_a_private_directory(tmp_path):
+    cache_dir = tmp_path / "matchers"
+    first = _vocabulary(cache_dir)
+    assert (cache_dir.stat().st_mode & 0o777) == 0o700
+    assert os.listdir(cache_dir) == [f"{first.fingerprint}.pickle"]
+    assert _vocabulary(cache_dir).find_skill_bits("Python and Docker") == (
+        first.find_skill_bits("Python and Docker")
+    )
+
+
+def test_matcher_cache_ignores_shared_directories_and_files(tmp_path):
+    fingerprint = _vocabulary(tmp_path / "probe").fingerprint
+
+    shared_dir = tmp_path / "shared"
+    shared_dir.mkdir()
+    shared_dir.chmod(0o777)
+    _plant(shared_dir, fingerprint)
+    assert _vocabulary(shared_dir).matcher != "planted"
+
+    private_dir = tmp_path / "private"
+    private_dir.mkdir(mode=0o700)
+    _plant(private_dir, fingerprint)
+    os.chmod(private_dir / f"{fingerprint}.pickle", 0o666)
+    assert _vocabulary(private_dir).matcher != "planted"
@@ -0,0 +1,15 @@
+from backend.services.spacy_assistant import SpacyAssistant
+
+
+def _unavailable() -> SpacyAssistant:
+    assistant = SpacyAssistant()
+    assistant.ner_nlp = None
+    assistant._nlp = None
+    return assistant
+
+
+def test_batch_apis_without_model_return_empty_results():
+    assistant = _unavailable()
+    assert assistant.parse_many(["Jane Doe", "John Smith"]) == [None, None]
+    assert assistant.parse("Jane Doe") is None
+    assert assistant.extract_names(["Jane Doe"]) == [None]
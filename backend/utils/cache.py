@@ -0,0 +1,233 @@
+"""
+Small caches shared by the parsing services.
+
+``LRUCache`` is an in-memory LRU bounded by entry count and by total size,
+``DiskCache`` keeps one file per key under a directory, and ``TieredCache``
+puts the first in front of the second. All of them are thread-safe and keep
+hit / miss counters for the admin API.
+"""
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional
+
+
+logger = logging.getLogger(__name__)
+
+
+class LRUCache:
+    """
+    Least-recently-used cache. ``max_entries`` and ``max_size`` (measured
+    with ``sizeof``) bound it; ``0`` means no bound on that dimension.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        max_size: int = 0,
+        sizeof: Optional[Callable[[Any], int]] = None,
+    ) -> None:
+        self.max_entries = max_entries
+        self.max_size = max_size
+        self._sizeof = sizeof or (lambda value: 0)
+        self._data: "OrderedDict[Hashable, Any]" = OrderedDict()
+        self._sizes: Dict[Hashable, int] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self.misses += 1
+                return default
+            self._data.move_to_end(key)
+            self.hits += 1
+            return value
+
+    def put(self, key: Hashable, value: Any) -> None:
+        size = self._sizeof(value)
+        if self.max_size and size > self.max_size:
+            # Would evict everything else and still not fit
+            return
+        with self._lock:
+            if key in self._data:
+                self._size -= self._sizes[key]
+            self._data[key] = value
+            self._data.move_to_end(key)
+            self._sizes[key] = size
+            self._size += size
+            while (self.max_entries and len(self._data) > self.max_entries) or (
+                self.max_size and self._size > self.max_size
+            ):
+                old_key, _ = self._data.popitem(last=False)
+                self._size -= self._sizes.pop(old_key)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._size = 0
+
+    def stats(self) -> dict:
+        return {
+            "entries": len(self._data),
+            "size": self._size,
+            "max_entries": self.max_entries,
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+        }
+
+
+class DiskCache:
+    """
+    One file per (string) key under ``directory``, sharded by the key's first
+    two characters. Values are bytes. Entries older than ``max_age`` seconds
+    (``0``: never) are deleted when read; ``prune`` sweeps the whole
+    directory. I/O errors are logged and treated as misses.
+    """
+
+    def __init__(self, directory: str, max_age: float = 0) -> None:
+        self.directory = directory
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.errors = 0
+        self.expired = 0
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, key[:2], key)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def _is_expired(self, path: str, now: float) -> bool:
+        return bool(self.max_age) and now - os.path.getmtime(path) > self.max_age
+
+    def _expire(self, path: str) -> None:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            return
+        self._count("expired")
+
+    def get(self, key: str) -> Optional[bytes]:
+        path = self._path(key)
+        try:
+            if self._is_expired(path, time.time()):
+                self._expire(path)
+                self._count("misses")
+                return None
+            with open(path, "rb") as f:
+                value = f.read()
+        except FileNotFoundError:
+            self._count("misses")
+            return None
+        except OSError:
+            logger.warning("Could not read cache file %s", path)
+            self._count("errors")
+            return None
+        self._count("hits")
+        return value
+
+    def put(self, key: str, value: bytes) -> None:
+        path = self._path(key)
+        try:
+            os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+            # Write-then-rename so concurrent readers never see half a file
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, "wb") as f:
+                f.write(value)
+            os.replace(tmp_path, path)
+        except OSError:
+            logger.warning("Could not write cache file %s", path)
+            self._count("errors")
+            return
+        self._count("writes")
+
+    def prune(self) -> None:
+        """Delete every expired entry under ``directory``."""
+        if not self.max_age:
+            return
+        now = time.time()
+        for root, _, files in os.walk(self.directory):
+            for name in files:
+                path = os.path.join(root, name)
+                try:
+                    if self._is_expired(path, now):
+                        self._expire(path)
+                except OSError:
+                    continue
+
+    def stats(self) -> dict:
+        return {
+            "directory": self.directory,
+            "max_age": self.max_age,
+            "hits": self.hits,
+            "misses": self.misses,
+            "writes": self.writes,
+            "expired": self.expired,
+            "errors": self.errors,
+        }
+
+
+class TieredCache:
+    """
+    An ``LRUCache`` in front of an optional ``DiskCache``. ``encode`` /
+    ``decode`` convert values to and from the bytes stored on disk; disk
+    hits are promoted into memory.
+    """
+
+    def __init__(
+        self,
+        memory: LRUCache,
+        disk: Optional[DiskCache] = None,
+        encode: Callable[[Any], bytes] = bytes,
+        decode: Callable[[bytes], Any] = bytes,
+    ) -> None:
+        self.memory = memory
+        self.disk = disk
+        self._encode = encode
+        self._decode = decode
+
+    def get(self, key: str) -> Any:
+        value = self.memory.get(key)
+        if value is not None or self.disk is None:
+            return value
+        raw = self.disk.get(key)
+        if raw is None:
+            return None
+        try:
+            value = self._decode(raw)
+        except Exception:
+            logger.warning("Ignoring undecodable cache entry %s", key)
+            return None
+        self.memory.put(key, value)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        self.memory.put(key, value)
+        if self.disk is not None:
+            self.disk.put(key, self._encode(value))
+
+    def stats(self) -> dict:
+        return {
+            "memory": self.memory.stats(),
+            "disk": self.disk.stats() if self.disk is not None else None,
+        }
@@ -0,0 +1,144 @@
+"""
+Typo-tolerant skill lookup backed by a character-trigram inverted index.
+
+Exact matching (see ``skill_matcher``) misses misspellings like "Pyhton" or
+"Kubernets". Comparing every unknown token against the whole vocabulary
+with edit distance would be far too slow, so the vocabulary's single-word
+surface forms are indexed by their trigrams once. A token then only gets
+scored against the handful of skills it shares trigrams with.
+"""
+
+import re
+from collections import Counter
+from typing import Dict, Iterable, List, Mapping, Optional, Tuple
+
+from .skill_matcher import lower_aligned
+
+
+WORD_REGEX = re.compile(r"[^\W\d_]+")
+
+# Short words are too easy to confuse ("scala"/"scale", "rust"/"trust").
+MIN_FUZZY_LENGTH = 6
+DEFAULT_FUZZY_THRESHOLD = 0.8
+# Cap on memoised token lookups so arbitrary input can't grow it forever
+_MEMO_LIMIT = 50_000
+
+
+def trigrams(word: str) -> List[str]:
+    padded = f" {word} "
+    return [padded[i : i + 3] for i in range(len(padded) - 2)]
+
+
+def edit_similarity(a: str, b: str) -> float:
+    """
+    1 - (optimal string alignment distance / longer length). Adjacent
+    transpositions count as one edit, so "pyhton" vs "python" scores 0.83.
+    """
+    if a == b:
+        return 1.0
+    prev2: List[int] = []
+    prev = list(range(len(b) + 1))
+    for i in range(1, len(a) + 1):
+        cur = [i] + [0] * len(b)
+        for j in range(1, len(b) + 1):
+            cost = 0 if a[i - 1] == b[j - 1] else 1
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + cost)
+            if i > 1 and j > 1 and a[i - 1] == b[j - 2] and a[i - 2] == b[j - 1]:
+                cur[j] = min(cur[j], prev2[j - 2] + 1)
+        prev2, prev = prev, cur
+    return 1.0 - prev[len(b)] / max(len(a), len(b))
+
+
+class TrigramSkillIndex:
+    """
+    Inverted index trigram -> single-word surface forms, built once per
+    vocabulary. ``lookup`` returns the best skill id above ``threshold``.
+    """
+
+    def __init__(
+        self,
+        lookup: Mapping[str, int],
+        threshold: float = DEFAULT_FUZZY_THRESHOLD,
+        min_length: int = MIN_FUZZY_LENGTH,
+    ) -> None:
+        self.threshold = threshold
+        self.min_length = min_length
+        self._exact = lookup
+        self._words: List[Tuple[str, int]] = []
+        self._postings: Dict[str, List[int]] = {}
+        self._memo: Dict[str, Optional[int]] = {}
+
+        for surface, skill_id in lookup.items():
+            if len(surface) < min_length - 1 or not WORD_REGEX.fullmatch(surface):
+                continue
+            index = len(self._words)
+            self._words.append((surface, skill_id))
+            for gram in set(trigrams(surface)):
+                self._postings.setdefault(gram, []).append(index)
+
+    def __len__(self) -> int:
+        return len(self._words)
+
+    def lookup(self, token: str) -> Optional[int]:
+        """Skill id closest to the lower-cased ``token``, or None."""
+        if token in self._memo:
+            return self._memo[token]
+
+        grams = set(trigrams(token))
+        shared = Counter()
+        for gram in grams:
+            shared.update(self._postings.get(gram, ()))
+
+        best_id, best_score = None, self.threshold
+        # Need at least a couple of trigrams in common to be worth scoring
+        min_shared = min(2, len(grams))
+        for index, count in shared.items():
+            if count < min_shared:
+                continue
+            surface, skill_id = self._words[index]
+            if abs(len(surface) - len(token)) > 2:
+                continue
+            score = edit_similarity(token, surface)
+            if score >= best_score:
+                best_id, best_score = skill_id, score
+
+        if len(self._memo) >= _MEMO_LIMIT:
+            self._memo.clear()
+        self._memo[token] = best_id
+        return best_id
+
+    def matches(
+        self,
+        text: str,
+        covered: Iterable[Tuple[int, int]] = (),
+        lowered: Optional[str] = None,
+    ) -> List[Tuple[int, int, int]]:
+        """
+        ``(start, end, skill_id)`` for words of ``text`` that are not exact
+        skills and do not overlap any ``covered`` ``(start, end)`` span.
+        """
+        if lowered is None:
+            lowered = lower_aligned(text)
+        # Merge covered spans into disjoint, sorted intervals
+        merged: List[List[int]] = []
+        for start, end in sorted(covered):
+            if merged and start < merged[-1][1]:
+                merged[-1][1] = max(merged[-1][1], end)
+            else:
+                merged.append([start, end])
+
+        span_i = 0
+        matches = []
+        for m in WORD_REGEX.finditer(lowered):
+            start, end = m.span()
+            while span_i < len(merged) and merged[span_i][1] <= start:
+                span_i += 1
+            if span_i < len(merged) and merged[span_i][0] < end:
+                continue
+            word = m.group(0)
+            if len(word) < self.min_length or word in self._exact:
+                continue
+            skill_id = self.lookup(word)
+            if skill_id is not None:
+                matches.append((start, end, skill_id))
+        return matches
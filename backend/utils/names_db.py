@@ -0,0 +1,54 @@
+"""
+Compact first-name / surname gazetteer for the rule-based name detector.
+
+Only common names are listed: the detector uses a hit to raise its
+confidence, never to reject a line, so a missing name just means that
+resume falls through to spaCy NER. Entries are lower-case.
+"""
+
+FIRST_NAMES = frozenset(
+    """
+    aaron abdul abhishek aditi aditya adrian ahmed aisha ajay akash akshay alan
+    albert alex alexander alexandra ali alice alicia allison amanda amar amir amit
+    amy ana anand andrea andrew angela anil anita anjali ankit ankita ann anna
+    anne anthony antonio anuj anup arjun arun ashish ashley asha ayesha barbara
+    ben benjamin beth betty bhavna brandon brian bruce carl carlos carol caroline
+    catherine charles charlotte chen chris christina christine christopher cindy
+    claire daniel david deepak deepika denise dennis derek dev diana divya donald
+    donna dorothy dylan edward elena elizabeth emily emma eric erica ethan eva
+    fatima frank gabriel gaurav gary george gita grace gregory hannah harish
+    harry heather helen henry hiroshi isabella ivan jack jacob james jane janet
+    jason jean jeffrey jennifer jessica jiang jin john jonathan jose joseph
+    joshua juan julia julie justin karan karen karthik kate katherine kavya kelly
+    kenneth kevin kim kiran kumar kunal laura lauren li lin linda lisa liu
+    lucas lucy luis madhu mahesh manish manoj margaret maria mark mary matthew
+    maya megan meera melissa michael michelle mike mohammed mohit mukesh nancy
+    naveen neha nicholas nicole nikhil nina nisha noah olivia omar pallavi pamela
+    patricia patrick paul pedro peter pooja prakash pranav prateek priya priyanka
+    rachel radha rahul raj rajesh rakesh ram ramesh raphael ravi rebecca rekha
+    richa richard rishabh rita robert rohan rohit ronald rose ruth ryan sachin
+    sahil samuel sandeep sandra sanjay sara sarah saurabh scott sean shalini
+    sharon shivam shreya shruti siddharth simran sneha sofia sophia stephanie
+    stephen steven sudha suman sumit sunil sunita suresh susan swati tanvi tanya
+    tarun thomas timothy tom tushar tyler uma usha varun vijay vikas vikram vinay
+    vinod vishal walter wei william yash yuki zhang zoe
+    """.split()
+)
+
+SURNAMES = frozenset(
+    """
+    adams agarwal aggarwal ahmed ali allen anderson bailey baker banerjee bansal
+    bell bennett bhatt bose brooks brown butler campbell carter chatterjee chauhan
+    chen chopra clark collins cook cooper cruz das davis desai dubey edwards
+    evans fernandes fernandez flores foster garcia ghosh gomez gonzalez goyal
+    gray green gupta hall harris hernandez hill hughes iyer jackson jain james
+    jenkins johnson jones joshi kapoor kaur khan khanna kim king kulkarni kumar
+    lee lewis li lopez mahajan malhotra martin martinez mehta menon miller mishra
+    mitchell moore morgan morris murphy murray nair nelson nguyen pandey parker
+    patel perez peterson phillips pillai price rao reddy reed richardson rivera
+    roberts robinson rodriguez rogers ross roy russell sanchez sanders saxena scott
+    sethi shah sharma shetty singh sinha smith srivastava stewart sullivan taylor
+    thomas thompson tiwari torres trivedi turner verma walker wang ward watson
+    white williams wilson wood wright wu yadav yang young zhang zhao
+    """.split()
+)
@@ -0,0 +1,38 @@
+"""
+Packed skill bitsets for scoring one JD against many stored candidates.
+
+Each candidate's skill bitset (an int, see ``skills_db.skills_to_bits``) is
+packed into one row of a ``uint8`` matrix. Overlap with a JD is then a
+vectorised AND plus a popcount lookup over the whole matrix.
+"""
+
+from typing import Sequence
+
+import numpy as np
+
+
+# popcount of every possible byte value
+_POPCOUNT = np.array([bin(i).count("1") for i in range(256)], dtype=np.uint8)
+
+
+def bitset_width(n_skills: int) -> int:
+    """Bytes needed per row for a vocabulary of ``n_skills``."""
+    return max(1, (n_skills + 7) // 8)
+
+
+def pack_bitsets(bitsets: Sequence[int], n_skills: int) -> np.ndarray:
+    """Pack int bitsets into a ``(len(bitsets), width)`` uint8 matrix."""
+    width = bitset_width(n_skills)
+    buffer = b"".join(bits.to_bytes(width, "little") for bits in bitsets)
+    return np.frombuffer(buffer, dtype=np.uint8).reshape(len(bitsets), width)
+
+
+def popcount(matrix: np.ndarray) -> np.ndarray:
+    """Number of set bits in every row."""
+    return _POPCOUNT[matrix].sum(axis=1, dtype=np.int64)
+
+
+def overlap_counts(matrix: np.ndarray, jd_bits: int) -> np.ndarray:
+    """Number of JD skills each candidate row has."""
+    jd_row = np.frombuffer(jd_bits.to_bytes(matrix.shape[1], "little"), dtype=np.uint8)
+    return popcount(np.bitwise_and(matrix, jd_row))
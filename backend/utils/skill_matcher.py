@@ -0,0 +1,262 @@
+"""
+Compiled multi-pattern skill matchers.
+
+Two engines share one interface (``finditer`` / ``find_all``):
+
+- ``SkillMatcher``: the whole vocabulary compiled into an Aho-Corasick
+  automaton, so a document is scanned a single time.
+- ``NgramSkillMatcher``: the text is tokenised once and every 1..N token
+  window is looked up in a hash index of skills. Cost depends on the text
+  length only, and the index stays small for vocabularies of 50k+ entries.
+
+Matches are only accepted on word boundaries, which we check against the
+characters *around* a match rather than with ``\\b``; that keeps skills that
+start or end with punctuation (``c++``, ``c#``, ``.net``) matchable.
+"""
+
+import re
+from array import array
+from collections import Counter, deque
+from typing import (
+    Dict,
+    Hashable,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    Optional,
+    Set,
+    Tuple,
+)
+
+
+TOKEN_REGEX = re.compile(r"\w+|[^\w\s]")
+
+ENGINES = ("automaton", "ngram")
+
+
+def is_word_char(ch: str) -> bool:
+    return ch.isalnum() or ch == "_"
+
+
+def lower_aligned(text: str) -> str:
+    """Lower-case ``text`` while keeping character offsets unchanged."""
+    lowered = text.lower()
+    if len(lowered) != len(text):
+        # A handful of characters lower-case to several code points; fall
+        # back to per-character lowering so offsets stay aligned with text.
+        lowered = "".join(c if len(c) == 1 else "\0" for c in map(str.lower, text))
+    return lowered
+
+
+class SkillMatcher:
+    """
+    Aho-Corasick automaton over lower-cased skill patterns.
+
+    ``patterns`` is either an iterable of skills or a mapping of surface form
+    -> value; every hit reports the value so callers can map several surface
+    forms onto one skill.
+    """
+
+    def __init__(self, patterns: Iterable[str] | Mapping[str, Hashable]) -> None:
+        if not isinstance(patterns, Mapping):
+            patterns = {p: p for p in patterns}
+
+        # State 0 is the root. ``_goto[state]`` maps a character to the next
+        # state, ``_output[state]`` holds (pattern length, value) pairs that
+        # end in that state (including ones inherited through failure links).
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._output: List[Tuple[Tuple[int, Hashable], ...]] = [()]
+
+        for surface, value in patterns.items():
+            surface = surface.strip().lower()
+            if surface:
+                self._add(surface, value)
+        self._build_failure_links()
+
+    def __len__(self) -> int:
+        return len(self._goto)
+
+    def _add(self, pattern: str, value: Hashable) -> None:
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._output.append(())
+            state = nxt
+        self._output[state] = self._output[state] + ((len(pattern), value),)
+
+    def _build_failure_links(self) -> None:
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                target = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = target if target != nxt else 0
+                inherited = self._output[self._fail[nxt]]
+                if inherited:
+                    self._output[nxt] = self._output[nxt] + inherited
+
+    def finditer(
+        self, text: str, lowered: Optional[str] = None
+    ) -> Iterator[Tuple[int, int, Hashable]]:
+        """
+        Yield ``(start, end, value)`` for every whole-word occurrence in ``text``.
+
+        Overlapping matches are all reported (e.g. both ``node`` and
+        ``node.js``), mirroring the old one-regex-per-skill behaviour.
+        Pass ``lowered`` (from ``lower_aligned``) if the caller already has it.
+        """
+        if lowered is None:
+            lowered = lower_aligned(text)
+        goto, fail, output = self._goto, self._fail, self._output
+        size = len(lowered)
+        state = 0
+        for i, ch in enumerate(lowered):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not output[state]:
+                continue
+            end = i + 1
+            if end < size and is_word_char(lowered[end]):
+                continue
+            for length, value in output[state]:
+                start = end - length
+                if start > 0 and is_word_char(lowered[start - 1]):
+                    continue
+                yield start, end, value
+
+    def find_all(self, text: str) -> Set[Hashable]:
+        """Return the distinct values of every pattern found in ``text``."""
+        return {value for _, _, value in self.finditer(text)}
+
+
+class NgramSkillMatcher:
+    """
+    Hash index of skills keyed by their text.
+
+    TOKEN_REGEX covers every non-space character, so a window of tokens in
+    the text is exactly the substring from its first token to its last and
+    is looked up as is: ``spring boot`` only matches with one space between
+    the words, as in the automaton, and both engines find the same matches.
+    A set of token-level prefixes lets a window stop growing as soon as no
+    skill can start with it, so most tokens cost a single failed lookup.
+    """
+
+    def __init__(self, patterns: Iterable[str] | Mapping[str, Hashable]) -> None:
+        if not isinstance(patterns, Mapping):
+            patterns = {p: p for p in patterns}
+
+        self._index: Dict[str, Tuple[Hashable, ...]] = {}
+        self._prefixes: Set[str] = set()
+        self.max_tokens = 0
+
+        for surface, value in patterns.items():
+            surface = surface.strip().lower()
+            token_ends = [m.end() for m in TOKEN_REGEX.finditer(surface)]
+            if not token_ends:
+                continue
+            for end in token_ends[:-1]:
+                self._prefixes.add(surface[:end])
+            self._index[surface] = self._index.get(surface, ()) + (value,)
+            self.max_tokens = max(self.max_tokens, len(token_ends))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def finditer(
+        self, text: str, lowered: Optional[str] = None
+    ) -> Iterator[Tuple[int, int, Hashable]]:
+        """Yield ``(start, end, value)`` for every whole-word occurrence in ``text``."""
+        if lowered is None:
+            lowered = lower_aligned(text)
+        spans = [m.span() for m in TOKEN_REGEX.finditer(lowered)]
+        index, prefixes, max_tokens = self._index, self._prefixes, self.max_tokens
+        size = len(lowered)
+
+        for i, (start, end) in enumerate(spans):
+            key = lowered[start:end]
+            j = i
+            while True:
+                values = index.get(key)
+                if values and not (
+                    (start > 0 and is_word_char(lowered[start - 1]))
+                    or (end < size and is_word_char(lowered[end]))
+                ):
+                    for value in values:
+                        yield start, end, value
+                j += 1
+                if j - i >= max_tokens or j >= len(spans) or key not in prefixes:
+                    break
+                end = spans[j][1]
+                key = lowered[start:end]
+
+    def find_all(self, text: str) -> Set[Hashable]:
+        """Return the distinct values of every pattern found in ``text``."""
+        return {value for _, _, value in self.finditer(text)}
+
+
+class SkillOccurrences:
+    """
+    Every skill occurrence in a document, as parallel arrays sorted by start.
+
+    ``skill_ids[i]`` was found at ``text[starts[i]:ends[i]]``. Overlapping hits
+    of the *same* skill (``node`` inside ``node.js`` when both map to one
+    skill) are collapsed into the longest one, so counts are not inflated.
+    """
+
+    __slots__ = ("skill_ids", "starts", "ends")
+
+    def __init__(self, matches: Iterable[Tuple[int, int, int]] = ()) -> None:
+        self.skill_ids = array("l")
+        self.starts = array("l")
+        self.ends = array("l")
+        last_end: Dict[int, int] = {}
+        for start, end, skill_id in sorted(matches, key=lambda m: (m[0], -m[1])):
+            if last_end.get(skill_id, -1) > start:
+                continue
+            last_end[skill_id] = end
+            self.skill_ids.append(skill_id)
+            self.starts.append(start)
+            self.ends.append(end)
+
+    def __len__(self) -> int:
+        return len(self.skill_ids)
+
+    def __iter__(self) -> Iterator[Tuple[int, int, int]]:
+        """Yield ``(skill_id, start, end)`` in document order."""
+        return zip(self.skill_ids, self.starts, self.ends)
+
+    def counts(self) -> Counter:
+        """Number of occurrences per skill id."""
+        return Counter(self.skill_ids)
+
+    def bits(self) -> int:
+        """Bitset of the distinct skill ids found."""
+        bits = 0
+        for skill_id in set(self.skill_ids):
+            bits |= 1 << skill_id
+        return bits
+
+
+def build_skill_matcher(
+    patterns: Iterable[str] | Mapping[str, Hashable], engine: str = "automaton"
+) -> SkillMatcher | NgramSkillMatcher:
+    """Compile ``patterns`` with the requested engine (see ``ENGINES``)."""
+    if engine == "automaton":
+        return SkillMatcher(patterns)
+    if engine == "ngram":
+        return NgramSkillMatcher(patterns)
+    raise ValueError(
+        f"Unknown skill matcher engine {engine!r}; expected one of {ENGINES}"
+    )
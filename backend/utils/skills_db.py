@@ -4,8 +4,34 @@ Centralised skill vocabulary.
 This list is intentionally broad but focused on common tech + general skills.
 It is used both for resume parsing and JD parsing so that we can do
 keyword-based matching in a robust way.
+
+The built-in list below is the default. A versioned JSON file can replace it
+(``SKILLS_VOCAB_PATH``) and be reloaded at runtime without a restart:
+
+    {"version": "2026-10-01", "skills": ["python", ...], "aliases": {"py": "python"}}
+
+Each load is compiled into an immutable ``SkillVocabulary`` and swapped in
+with a single reference assignment, so requests that already grabbed the
+previous vocabulary finish with it undisturbed.
+
+Every worker process holds its own vocabulary. ``VocabularyWatcher`` keeps
+each of them in sync with the file, and ``notify_vocabulary_watchers``
+touches the file so a reload triggered in one worker reaches the others.
 """
 
+import hashlib
+import json
+import logging
+import os
+import pickle
+import threading
+from typing import Dict, Iterable, List, Mapping, Optional
+
+from .fuzzy_skills import DEFAULT_FUZZY_THRESHOLD, TrigramSkillIndex
+from .skill_matcher import SkillOccurrences, build_skill_matcher
+
+logger = logging.getLogger(__name__)
+
 CORE_SKILLS = [
     # Programming languages
     "python",
@@ -31,9 +57,7 @@ CORE_SKILLS = [
     "powershell",
     # Frameworks & libraries
     "react",
-    "react.js",
     "node.js",
-    "node",
     "django",
     "flask",
     "fastapi",
@@ -54,10 +78,8 @@ CORE_SKILLS = [
     "tensorflow",
     "pytorch",
     "keras",
-    "ml",
     "machine learning",
     "deep learning",
-    "nlp",
     "natural language processing",
     "computer vision",
     "opencv",
@@ -121,11 +143,361 @@ CORE_SKILLS = [
 ]
 
 
+# Other surface forms of a skill, mapped to its canonical entry in CORE_SKILLS.
+# Aliases are matched like any other skill but always report the canonical
+# one, so "react.js" in a resume and "React" in a JD count as the same skill.
+SKILL_ALIASES = {
+    "react.js": "react",
+    "reactjs": "react",
+    "node": "node.js",
+    "nodejs": "node.js",
+    "express.js": "express",
+    "vue.js": "vue",
+    "vuejs": "vue",
+    "angularjs": "angular",
+    "golang": "go",
+    "ml": "machine learning",
+    "nlp": "natural language processing",
+    "sklearn": "scikit-learn",
+    "k8s": "kubernetes",
+    "amazon web services": "aws",
+    "google cloud": "gcp",
+    "postgres": "postgresql",
+    "mongo": "mongodb",
+}
+
+
 def normalise_skill(skill: str) -> str:
     return skill.strip().lower()
 
 
 NORMALISED_SKILLS = {normalise_skill(s) for s in CORE_SKILLS}
 
+# Set SKILL_MATCHER_ENGINE=ngram for very large (taxonomy-sized) vocabularies.
+SKILL_MATCHER_ENGINE = os.getenv("SKILL_MATCHER_ENGINE", "automaton")
+
+# Compiled matchers are cached on disk keyed by the vocabulary fingerprint, so
+# every worker after the first loads them with one read instead of rebuilding.
+# The files are pickles, so they are only used from a directory that belongs
+# to the current user and that nobody else can write to.
+# Set SKILL_MATCHER_CACHE_DIR to an empty string to disable the cache.
+SKILL_MATCHER_CACHE_DIR = os.getenv(
+    "SKILL_MATCHER_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".cache", "remtch", "skill-matcher"),
+)
+# Bump when the matcher classes change shape so stale pickles are ignored.
+MATCHER_CACHE_FORMAT = 2
+
+# Optional typo-tolerant matching ("Pyhton", "Kubernets") on top of the exact
+# matcher. Off by default: it trades some precision for recall.
+SKILL_FUZZY_MATCHING = os.getenv("SKILL_FUZZY_MATCHING", "").lower() in {
+    "1",
+    "true",
+    "yes",
+}
+SKILL_FUZZY_THRESHOLD = float(
+    os.getenv("SKILL_FUZZY_THRESHOLD", str(DEFAULT_FUZZY_THRESHOLD))
+)
+
+
+def ids_to_bits(skill_ids: Iterable[int]) -> int:
+    bits = 0
+    for skill_id in skill_ids:
+        bits |= 1 << skill_id
+    return bits
+
+
+def _is_private(st: os.stat_result) -> bool:
+    """Owned by the current user and not writable by group or others."""
+    return st.st_uid == os.getuid() and not st.st_mode & 0o022
+
+
+def _private_cache_dir(cache_dir: str) -> bool:
+    """Create ``cache_dir`` (mode 0700) if needed; True if it is private."""
+    try:
+        os.makedirs(cache_dir, mode=0o700, exist_ok=True)
+        return _is_private(os.stat(cache_dir))
+    except OSError:
+        return False
+
+
+def _load_or_build_matcher(
+    lookup: Dict[str, int], engine: str, fingerprint: str, cache_dir: str
+):
+    if not cache_dir:
+        return build_skill_matcher(lookup, engine)
+    if not _private_cache_dir(cache_dir):
+        # Unpickling a file someone else could have planted runs their code
+        logger.warning(
+            "Not using skill matcher cache %s: it must be a directory owned by "
+            "this user and not writable by others",
+            cache_dir,
+        )
+        return build_skill_matcher(lookup, engine)
+
+    path = os.path.join(cache_dir, f"{fingerprint}.pickle")
+    try:
+        with open(path, "rb") as f:
+            if _is_private(os.fstat(f.fileno())):
+                return pickle.loads(f.read())
+            logger.warning("Ignoring skill matcher cache %s: not private", path)
+    except FileNotFoundError:
+        pass
+    except Exception:
+        logger.warning("Ignoring unreadable skill matcher cache %s", path)
+
+    matcher = build_skill_matcher(lookup, engine)
+    try:
+        # Write-then-rename so concurrently starting workers never read a
+        # half-written file.
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+        with open(fd, "wb") as f:
+            pickle.dump(matcher, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        logger.warning("Could not write skill matcher cache %s", path)
+    return matcher
+
+
+class SkillVocabulary:
+    """
+    One compiled version of the skill vocabulary.
+
+    - Stable integer id per skill: the position of its first appearance in
+      ``skills``. Append new skills at the end so ids never move.
+    - ``lookup`` maps every surface form (canonical skills and aliases) to the
+      canonical skill id; the matcher is compiled from this single table.
+
+    Instances are never mutated after construction.
+    """
+
+    def __init__(
+        self,
+        skills: Iterable[str],
+        aliases: Optional[Mapping[str, str]] = None,
+        version: str = "builtin",
+        engine: str = SKILL_MATCHER_ENGINE,
+        cache_dir: str = SKILL_MATCHER_CACHE_DIR,
+        fuzzy: bool = SKILL_FUZZY_MATCHING,
+        fuzzy_threshold: float = SKILL_FUZZY_THRESHOLD,
+    ) -> None:
+        self.version = version
+        self.skill_ids: Dict[str, int] = {}
+        for skill in skills:
+            skill = normalise_skill(skill)
+            if skill:
+                self.skill_ids.setdefault(skill, len(self.skill_ids))
+        self.skills_by_id: List[str] = list(self.skill_ids)
+
+        self.lookup: Dict[str, int] = dict(self.skill_ids)
+        for alias, canonical in (aliases or {}).items():
+            skill_id = self.skill_ids.get(normalise_skill(canonical))
+            if skill_id is None:
+                raise ValueError(
+                    f"Alias {alias!r} points to unknown skill {canonical!r}"
+                )
+            self.lookup.setdefault(normalise_skill(alias), skill_id)
+
+        # Identifies the compiled content regardless of where it came from;
+        # used as the on-disk cache key and by caches of derived results.
+        content = [
+            MATCHER_CACHE_FORMAT,
+            engine,
+            self.skills_by_id,
+            sorted(self.lookup.items()),
+        ]
+        self.fingerprint = hashlib.sha256(
+            json.dumps(content).encode("utf-8")
+        ).hexdigest()
+
+        # Every hit reports the canonical skill id, so a document's skills come
+        # out as ids/bitsets with aliases already folded in.
+        self.matcher = _load_or_build_matcher(
+            self.lookup, engine, self.fingerprint, cache_dir
+        )
+        self.fuzzy_index = (
+            TrigramSkillIndex(self.lookup, fuzzy_threshold) if fuzzy else None
+        )
+
+    @classmethod
+    def from_file(
+        cls,
+        path: str,
+        engine: str = SKILL_MATCHER_ENGINE,
+        cache_dir: str = SKILL_MATCHER_CACHE_DIR,
+    ) -> "SkillVocabulary":
+        with open(path, encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict) or not isinstance(data.get("skills"), list):
+            raise ValueError(f"{path}: expected an object with a 'skills' list")
+        return cls(
+            data["skills"],
+            data.get("aliases") or {},
+            version=str(data.get("version", "unversioned")),
+            engine=engine,
+            cache_dir=cache_dir,
+        )
+
+    def __len__(self) -> int:
+        return len(self.skills_by_id)
+
+    def find_skill_bits(self, text: str) -> int:
+        """Single scan of ``text``; returns the bitset of skills found."""
+        if self.fuzzy_index is not None:
+            return self.scan(text).bits()
+        return ids_to_bits(self.matcher.find_all(text))
+
+    def scan(self, text: str, lowered: Optional[str] = None) -> SkillOccurrences:
+        """
+        Single scan of ``text`` returning every occurrence with its character
+        offsets, for counts, weighting and highlighting without re-scanning.
+
+        With fuzzy matching enabled, words not covered by an exact match are
+        also looked up in the trigram index. ``lowered`` is the text from
+        ``skill_matcher.lower_aligned``, if the caller already has it.
+        """
+        matches = list(self.matcher.finditer(text, lowered))
+        if self.fuzzy_index is not None:
+            covered = [(start, end) for start, end, _ in matches]
+            matches.extend(self.fuzzy_index.matches(text, covered, lowered))
+        return SkillOccurrences(matches)
+
+    def skills_to_bits(self, skills: Iterable[str]) -> int:
+        """
+        Pack skills into an int bitset (bit ``i`` set <=> skill id ``i`` present).
+        Aliases count as their canonical skill; unknown skills are ignored.
+        """
+        bits = 0
+        for skill in skills:
+            skill_id = self.lookup.get(normalise_skill(skill))
+            if skill_id is not None:
+                bits |= 1 << skill_id
+        return bits
+
+    def bits_to_skills(self, bits: int) -> List[str]:
+        """Unpack a bitset into canonical skill names, in id order."""
+        skills = []
+        while bits:
+            low = bits & -bits
+            skills.append(self.skills_by_id[low.bit_length() - 1])
+            bits ^= low
+        return skills
+
+
+SKILLS_VOCAB_PATH = os.getenv("SKILLS_VOCAB_PATH")
+
+def _file_mtime(path: str) -> Optional[float]:
+    try:
+        return os.stat(path).st_mtime
+    except OSError:
+        return None
+
+
+_reload_lock = threading.Lock()
+# mtime of the file the current vocabulary was read from, so this process's
+# watcher can skip a change it has already loaded
+_vocabulary_mtime = _file_mtime(SKILLS_VOCAB_PATH) if SKILLS_VOCAB_PATH else None
+_vocabulary = (
+    SkillVocabulary.from_file(SKILLS_VOCAB_PATH)
+    if SKILLS_VOCAB_PATH
+    else SkillVocabulary(CORE_SKILLS, SKILL_ALIASES)
+)
+
+
+def get_vocabulary() -> SkillVocabulary:
+    """
+    The vocabulary currently in use. Grab it once per request and pass it
+    along so a concurrent reload cannot mix two versions in one response.
+    """
+    return _vocabulary
+
+
+def reload_vocabulary(path: Optional[str] = None) -> SkillVocabulary:
+    """
+    Compile the vocabulary at ``path`` (default ``SKILLS_VOCAB_PATH``, or the
+    built-in list) and atomically make it the current one.
+
+    Compilation happens before the swap, so a bad file raises and leaves the
+    running vocabulary untouched.
+    """
+    global _vocabulary, _vocabulary_mtime
+    path = path or SKILLS_VOCAB_PATH
+    with _reload_lock:
+        # Taken before reading, so a write during the read still looks new
+        mtime = _file_mtime(path) if path else None
+        vocabulary = (
+            SkillVocabulary.from_file(path)
+            if path
+            else SkillVocabulary(CORE_SKILLS, SKILL_ALIASES)
+        )
+        _vocabulary, _vocabulary_mtime = vocabulary, mtime
+    return vocabulary
+
+
+def notify_vocabulary_watchers(path: Optional[str] = None) -> bool:
+    """
+    Bump the mtime of the vocabulary file so the ``VocabularyWatcher`` of
+    every other worker process reloads it; this process's watcher skips it.
+    Call after a successful ``reload_vocabulary``.
+
+    Returns False when there is no file or it can't be touched. Workers only
+    notice when SKILLS_VOCAB_WATCH_INTERVAL runs a watcher in each of them.
+    """
+    global _vocabulary_mtime
+    path = path or SKILLS_VOCAB_PATH
+    if not path:
+        return False
+    with _reload_lock:
+        loaded = _file_mtime(path) == _vocabulary_mtime
+        try:
+            os.utime(path)
+        except OSError:
+            logger.warning("Could not touch %s to notify other workers", path)
+            return False
+        # If the file changed again since our reload, leave the old mtime so
+        # our own watcher picks that change up as well
+        if loaded:
+            _vocabulary_mtime = _file_mtime(path)
+    return True
+
+
+class VocabularyWatcher:
+    """
+    Polls the vocabulary file's mtime in a daemon thread and reloads it when
+    it changes. Failed reloads are reported and the old vocabulary kept.
+    """
+
+    def __init__(self, path: str, interval: float = 5.0) -> None:
+        self.path = path
+        self.interval = interval
+        self._stop = threading.Event()
+        self._thread = threading.Thread(
+            target=self._run, name="skills-vocab-watcher", daemon=True
+        )
+
+    def start(self) -> None:
+        self._thread.start()
 
+    def stop(self) -> None:
+        self._stop.set()
 
+    def _run(self) -> None:
+        last = _file_mtime(self.path)
+        while not self._stop.wait(self.interval):
+            current = _file_mtime(self.path)
+            if current is None or current == last:
+                continue
+            last = current
+            if current == _vocabulary_mtime:
+                # Already loaded here, e.g. by the admin reload endpoint
+                continue
+            try:
+                vocabulary = reload_vocabulary(self.path)
+                logger.info(
+                    "Reloaded skill vocabulary %s (%d skills)",
+                    vocabulary.version,
+                    len(vocabulary),
+                )
+            except Exception:
+                logger.exception("Skill vocabulary reload from %s failed", self.path)
@@ -60,8 +60,10 @@ function AppInner() {
         resultsRef.current?.scrollIntoView({ behavior: "smooth", block: "start" });
       }, 300);
     } catch (err) {
+      const detail = err?.response?.data?.detail;
       const message =
-        err?.response?.data?.detail ||
+        detail?.message ||
+        detail ||
         "Something went wrong while analyzing the resume. Please try again.";
       addToast({
         type: "error",